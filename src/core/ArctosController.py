@@ -7,11 +7,12 @@ one instance of ArctosController manages the servos at any given time.
 """
 import math
 import can
+import numpy as np
 import time
-from typing import List
+from typing import List, Optional
 import logging
 from services.mks_servo_can import mks_servo
-from services.mks_servo_can.mks_enums import Enable
+from services.mks_servo_can.mks_enums import Enable, MksCommands
 import concurrent.futures
 from .CanBusManager import CanBusManager
 
@@ -118,6 +119,24 @@ class ArctosController:
         encoder_value = int((angle_rad / (2 * math.pi)) * self.encoder_resolution * gear_ratio)
         return encoder_value
 
+    def angles_to_encoders(self, angles_rad: np.ndarray) -> np.ndarray:
+        """
+        Converts joint angles from radians to encoder values for all axes at once.
+
+        Vectorized counterpart of `angle_to_encoder`: the last axis of `angles_rad` indexes the
+        joints, so a single configuration or a whole (N, n_joints) trajectory can be converted
+        in one call. Values are truncated towards zero exactly like `angle_to_encoder`.
+
+        Args:
+            angles_rad (np.ndarray): Joint angles in radians, shape (n_joints,) or (N, n_joints).
+
+        Returns:
+            np.ndarray: The encoder values as int64, same shape as `angles_rad`.
+        """
+        angles_rad = np.asarray(angles_rad, dtype=np.float64)
+        gear_ratios = np.asarray(self.gear_ratios[:angles_rad.shape[-1]], dtype=np.float64)
+        return ((angles_rad / (2 * math.pi)) * self.encoder_resolution * gear_ratios).astype(np.int64)
+
     def encoder_to_angle(self, encoder_value: int, axis_index: int) -> float:
         """
         Converts an encoder value to a joint angle in radians for a given axis.
@@ -276,44 +295,96 @@ class ArctosController:
             logger.warning(f"Error reading encoder for Axis {i}: {e}")
             return 0
 
-    def _read_and_convert_angle(self, i: int, servo) -> float:
-        """
-        Helper function for parallel execution. Reads a single servo's encoder value
-        and converts it to an angle in radians.
+    def read_encoders_batch(self, axes: Optional[List[int]] = None) -> np.ndarray:
         """
-        encoder_value = self._read_encoder_with_fallback(i, servo)
-        return self.encoder_to_angle(encoder_value, i)
+        Reads the encoder values of several axes with a single burst of CAN frames.
+
+        All read requests are sent back-to-back and the replies are harvested by a listener
+        keyed by arbitration ID on each distinct notifier (servos on separate buses each have
+        their own), so the wall time is roughly one round-trip instead of one per axis.
+
+        An axis that was asked but did not answer within the servo timeout reads as 0 and
+        is not retried: a dead servo then costs one timeout per call, not two. Only axes
+        whose request could not be sent at all are read again individually via
+        `_read_encoder_with_fallback`.
+
+        Args:
+            axes (Optional[List[int]]): Zero-based axis indices to read. Defaults to all servos.
+
+        Returns:
+            np.ndarray: The encoder values as int64, ordered like `axes`.
+        """
+        if axes is None:
+            axes = range(len(self.servos))
+        axes = list(axes)
+        values = np.zeros(len(axes), dtype=np.int64)
+        if not axes:
+            return values
+
+        op_code = MksCommands.READ_ENCODED_VALUE_ADDITION.value
+        replies = {}
+
+        def make_collector(slot_by_id):
+            def collect(message):
+                slot = slot_by_id.get(message.arbitration_id)
+                if slot is None or slot in replies:
+                    return
+                data = message.data
+                if len(data) != 8 or data[0] != op_code:
+                    return
+                if (message.arbitration_id + sum(data[:-1])) & 0xFF != data[-1]:
+                    return
+                replies[slot] = int.from_bytes(data[1:7], byteorder="big", signed=True)
+            return collect
+
+        # One collector per notifier, matching only the CAN IDs of the servos on that notifier
+        slots_by_notifier = {}
+        for slot, axis in enumerate(axes):
+            notifier = self.servos[axis].notifier
+            slots_by_notifier.setdefault(id(notifier), (notifier, {}))[1][self.servos[axis].can_id] = slot
+        listeners = [(notifier, make_collector(slot_by_id)) for notifier, slot_by_id in slots_by_notifier.values()]
+
+        sent = set()
+        for notifier, collect in listeners:
+            notifier.add_listener(collect)
+        try:
+            for slot, axis in enumerate(axes):
+                servo = self.servos[axis]
+                try:
+                    servo.bus.send(servo.create_can_msg([op_code]))
+                    sent.add(slot)
+                except can.CanError as e:
+                    logger.warning(f"⚠️ Batched encoder read request for Axis {axis} failed, falling back to a single read: {e}")
+            deadline = time.perf_counter() + max(self.servos[axis].timeout for axis in axes)
+            while len(replies) < len(sent) and time.perf_counter() < deadline:
+                time.sleep(0.001)
+        finally:
+            for notifier, collect in listeners:
+                notifier.remove_listener(collect)
+
+        for slot, axis in enumerate(axes):
+            if slot in replies:
+                values[slot] = replies[slot]
+            elif slot in sent:
+                logger.warning(f"Failed to read encoder value for Axis {axis}, setting to 0.")
+            else:
+                values[slot] = self._read_encoder_with_fallback(axis, self.servos[axis])
+        return values
 
     def get_joint_angles(self) -> List[float]:
         """
-        Retrieves the current joint angles of the robot by reading all servos in parallel.
+        Retrieves the current joint angles of the robot with one batched encoder read.
 
-        This method uses a thread pool to read the encoder values from all servos concurrently,
-        significantly speeding up the process compared to a serial approach.
+        The encoder values of all servos are requested in a single CAN burst via
+        `read_encoders_batch` and converted to radians in one vectorized step.
 
         Returns:
             list[float]: A list containing the current joint angles in radians.
                          The list is ordered by joint index.
         """
-        angles_rad = [0.0] * len(self.servos)  # Pre-allocate list for results
-
-        # Use a ThreadPoolExecutor to read from all servos in parallel.
-        # max_workers is set to the number of servos to ensure all reads start concurrently.
-        with concurrent.futures.ThreadPoolExecutor(max_workers=len(self.servos)) as executor:
-            # Map each future to its corresponding joint index
-            future_to_index = {
-                executor.submit(self._read_and_convert_angle, i, servo): i
-                for i, servo in enumerate(self.servos)
-            }
-
-            for future in concurrent.futures.as_completed(future_to_index):
-                index = future_to_index[future]
-                try:
-                    # Store the result in the correct position in the list
-                    angles_rad[index] = future.result()
-                except Exception as exc:
-                    logger.error(f'Reading joint {index} generated an exception: {exc}')
-                    # The angle will remain 0.0 as pre-allocated
+        encoders = self.read_encoders_batch()
+        gear_ratios = np.asarray(self.gear_ratios[:len(encoders)], dtype=np.float64)
+        angles_rad = ((encoders / (self.encoder_resolution * gear_ratios)) * (2 * math.pi)).tolist()
 
         if logger.isEnabledFor(logging.DEBUG):
             formatted_angles = ", ".join([f"{angle:.4f}" for angle in angles_rad])
@@ -379,19 +450,49 @@ class ArctosController:
         except Exception as e:
             logger.debug(f"Error sending close gripper command: {e}")
 
-    def wait_for_motors_to_stop(self) -> None:
+    def wait_for_motors_to_stop(self, axis: Optional[int] = None) -> None:
         """
-        Waits until all motors have stopped moving.
+        Waits until all motors, or a single one, have stopped moving.
 
         This method continuously checks the state of each servo motor to see if it is still running.
         It waits until all motors have stopped moving before returning. This is useful to ensure that
         all motions have completed before proceeding to the next operation.
 
+        Args:
+            axis (Optional[int]): 1-based axis number to wait for. Defaults to None (all motors),
+                which lets concurrent callers wait for their own axis only.
         """
-        while any(servo.is_motor_running() for servo in self.servos):
+        servos = self.servos if axis is None else [self.servos[axis - 1]]
+        while any(servo.is_motor_running() for servo in servos):
             logger.debug("Motors are still running. Waiting...")
             time.sleep(0.5)  # Wait before checking again
 
+    def wait_until_idle(self, axis: int, timeout: float = 0.5) -> bool:
+        """
+        Waits a bounded time for a single motor to report that it is no longer running.
+
+        Meant as a short settle check after `wait_for_motors_to_stop`, not for waiting out a
+        whole move: it uses the servo's own `wait_for_motor_idle`, which polls the status every
+        100 ms, and gives up after `timeout`. A servo that stops answering (no status reply
+        counts as running) therefore cannot block the caller forever.
+
+        Args:
+            axis (int): 1-based axis number.
+            timeout (float): Maximum number of seconds to wait, must be positive. Defaults to 0.5.
+
+        Returns:
+            bool: True if the motor is idle, False if the timeout expired first.
+
+        Raises:
+            ValueError: If timeout is not positive (the servo library treats 0/None as "no limit").
+        """
+        if timeout is None or timeout <= 0:
+            raise ValueError(f"timeout must be positive, got {timeout!r}")
+        if self.servos[axis - 1].wait_for_motor_idle(timeout):
+            logger.warning(f"⚠️ Axis {axis} still running after {timeout:.2f} s")
+            return False
+        return True
+
     def is_motor_running(self) -> bool:
         """
         Check if any motor is still running.
@@ -430,6 +531,32 @@ class ArctosController:
             except Exception as e:
                 logger.error(f"Failed to send emergency stop to servo {i}: {e}")
 
+    def stop_all_speed_mode(self, axes: List[int], accel: int) -> int:
+        """
+        Commands several motors to 0 RPM in speed mode with one burst of CAN frames.
+
+        The stop frames are sent back-to-back without waiting for the individual replies, so
+        all axes start decelerating within one bus round-trip instead of one per axis.
+
+        Args:
+            axes (List[int]): Zero-based indices of the axes to stop.
+            accel (int): Deceleration in the range 0 to 255.
+
+        Returns:
+            int: The number of stop frames that were sent.
+        """
+        op_code = MksCommands.RUN_MOTOR_SPEED_MODE_COMMAND.value
+        sent = 0
+        for axis in axes:
+            servo = self.servos[axis]
+            try:
+                servo.bus.send(servo.create_can_msg([op_code, 0, 0, accel]))
+                sent += 1
+            except Exception as e:
+                # Keep going on any error: the remaining axes must still get their stop frame
+                logger.error(f"Servo {axis}: Failed to send stop frame: {e}")
+        return sent
+
     def safe_emergency_stop(self) -> None:
         """
         Performs a safe emergency stop:
@@ -438,7 +565,6 @@ class ArctosController:
         Logs actions and errors.
         """
         from services.mks_servo_can.can_motor import MAX_ACCELERATION
-        from services.mks_servo_can.mks_enums import Direction
         high_rpm_detected = False
         rpm_list = []
         if not hasattr(self, 'servos') or self.servos is None:
@@ -456,17 +582,15 @@ class ArctosController:
                 rpm_list.append(None)
         if high_rpm_detected:
             logger.warning("High RPM detected. Decelerating motors safely.")
-            for i, (servo, rpm) in enumerate(zip(self.servos, rpm_list)):
-                try:
-                    if rpm is None:
-                        logger.warning(f"Servo {i}: RPM unknown, skipping deceleration.")
-                        continue
-                    direction = Direction.CCW if rpm > 0 else Direction.CW
-                    # Command motor to zero speed with max acceleration
-                    result = servo.run_motor_in_speed_mode(direction, 0, MAX_ACCELERATION)
-                    logger.debug(f"Servo {i}: Decelerate to 0 RPM with MAX_ACCELERATION. Result: {result}")
-                except Exception as e:
-                    logger.error(f"Servo {i}: Failed to decelerate safely: {e}")
+            axes = []
+            for i, rpm in enumerate(rpm_list):
+                if rpm is None:
+                    logger.warning(f"Servo {i}: RPM unknown, skipping deceleration.")
+                else:
+                    axes.append(i)
+            # Command all motors to zero speed with max acceleration in a single burst
+            sent = self.stop_all_speed_mode(axes, MAX_ACCELERATION)
+            logger.debug("Decelerate to 0 RPM with MAX_ACCELERATION sent to %d servos.", sent)
         else:
             logger.debug("All motors below 1000 RPM. Performing normal emergency stop.")
             self.emergency_stop()
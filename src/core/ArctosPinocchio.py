@@ -6,7 +6,6 @@ from pink.tasks import FrameTask
 from pink.limits.configuration_limit import ConfigurationLimit
 from pink.limits.velocity_limit import VelocityLimit
 from pink import solve_ik, Configuration
-from scipy.spatial.transform import Rotation as R
 from robomeshcat import Scene, Robot
 
 
@@ -68,6 +67,7 @@ class ArctosPinocchioRobot:
         # Load kinematic model
         self.model = pin.buildModelFromUrdf(urdf_path)
         self.data = self.model.createData()
+        self.ee_frame_id = self.model.getFrameId(self.ee_frame_name)  # Resolved once; the model is fixed
 
         # Load geometric model (Visual)
         self.geom_model = pin.buildGeomFromUrdf(
@@ -102,6 +102,9 @@ class ArctosPinocchioRobot:
 
         # Robot state
         self.q = np.zeros(self.model.nq)
+        # Last joint angles read from the encoders. Only kept current by the live encoder reader
+        # (utils.stream_encoder_labels), which runs only while a control page with live joint
+        # updates is open and visible; otherwise this holds the last reading and may be stale.
         self.q_encoder = np.zeros(self.model.nq)
         self.ee_position = np.zeros(3)
         self.ee_orientation = np.zeros(3)
@@ -111,8 +114,7 @@ class ArctosPinocchioRobot:
         self.jaw2_idx = self.model.getJointId('jaw2')
         self.gripper_open = True  # Track gripper state
 
-        self.update_end_effector_position()
-        self.update_end_effector_orientation()
+        self.update_end_effector_pose()
         self.display()
 
 
@@ -152,6 +154,21 @@ class ArctosPinocchioRobot:
 
         return True
 
+    def check_joint_limits_batch(self, q: np.ndarray) -> np.ndarray:
+        """Checks a batch of joint configurations against the joint limits in one vectorized pass.
+
+        Like `check_joint_limits`, only the first 6 joint values of each configuration are considered.
+        Nothing is logged; call `check_joint_limits` on a failing row to report the violations.
+
+        Args:
+            q (np.ndarray): Joint configurations of shape (N, n_joints), or a single configuration.
+
+        Returns:
+            np.ndarray: Boolean mask of shape (N,), True where the configuration is within limits.
+        """
+        q_limited = np.atleast_2d(q)[:, :6]
+        return ((q_limited >= self.lower_limits[:6]) & (q_limited <= self.upper_limits[:6])).all(axis=1)
+
 
 
 
@@ -180,8 +197,7 @@ class ArctosPinocchioRobot:
         self.q = q  # Update internal state
         self.robot[:] = q
         self.scene.render()
-        self.update_end_effector_position()
-        self.update_end_effector_orientation()
+        self.update_end_effector_pose()
         logger.debug("✅ Robot state updated and displayed.")
     
     
@@ -202,7 +218,9 @@ class ArctosPinocchioRobot:
             raise TypeError("❌ Joint configuration must be a NumPy array.")
             
         q_start = self.q.copy()
-        trajectory = [(1 - t / steps) * q_start + (t / steps) * q_target for t in range(steps + 1)]
+        # All animation frames in one preallocated (steps + 1, nq) array instead of a list of per-frame temporaries
+        t = np.linspace(0.0, 1.0, steps + 1)[:, np.newaxis]
+        trajectory = (1.0 - t) * q_start + t * q_target
         
         fps = steps / duration if duration > 0 else 30
 
@@ -214,9 +232,21 @@ class ArctosPinocchioRobot:
 
         # Ensure final state is updated
         self.q = q_target
-        self.update_end_effector_position()
-        self.update_end_effector_orientation()
+        self.update_end_effector_pose()
+
+
+    def update_end_effector_pose(self) -> None:
+        """Updates the end-effector's position and RPY orientation with a single kinematics pass.
+
+        Equivalent to calling `update_end_effector_position` and `update_end_effector_orientation`,
+        but the forward kinematics and frame placements are computed only once.
+        """
+        frame_id = self.ee_frame_id
+        pin.framesForwardKinematics(self.model, self.data, self.q)  # FK + frame placements in one call
 
+        placement = self.data.oMf[frame_id]
+        self.ee_position = placement.translation
+        self.ee_orientation = pin.rpy.matrixToRpy(placement.rotation)
 
     def update_end_effector_orientation(self) -> None:
         """Updates the end-effector's Roll-Pitch-Yaw (RPY) orientation.
@@ -227,7 +257,7 @@ class ArctosPinocchioRobot:
 
         Raises:
         """
-        frame_id = self.model.getFrameId(self.ee_frame_name)  # Frame-ID abrufen
+        frame_id = self.ee_frame_id
         pin.forwardKinematics(self.model, self.data, self.q)  # Kinematik aktualisieren
         pin.updateFramePlacements(self.model, self.data)  # Frame-Positionen aktualisieren
 
@@ -242,7 +272,7 @@ class ArctosPinocchioRobot:
 
         Raises:
         """
-        frame_id = self.model.getFrameId(self.ee_frame_name)
+        frame_id = self.ee_frame_id
         pin.forwardKinematics(self.model, self.data, self.q)
         pin.updateFramePlacements(self.model, self.data)
         self.ee_position = self.data.oMf[frame_id].translation
@@ -324,9 +354,10 @@ class ArctosPinocchioRobot:
         """
         # Compute target rotation
         if target_rpy is not None:
-            target_rot = R.from_euler('xyz', target_rpy).as_matrix()
+            # Same convention as scipy's 'xyz' Euler and matrixToRpy: R = Rz(yaw) @ Ry(pitch) @ Rx(roll)
+            target_rot = pin.rpy.rpyToMatrix(np.asarray(target_rpy, dtype=np.float64))
         else:
-            frame_id = self.model.getFrameId(self.ee_frame_name)
+            frame_id = self.ee_frame_id
             pin.forwardKinematics(self.model, self.data, self.q)
             pin.updateFramePlacements(self.model, self.data)
             target_rot = self.data.oMf[frame_id].rotation
@@ -1,14 +1,56 @@
+import bisect
 import json
+import mmap
 import numpy as np
 from typing import List, Dict, Optional, Tuple, Any
 import logging
 import os
+import re
 import time 
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from meshcat.geometry import Sphere
 from robomeshcat import Object
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib parser
+    orjson = None
+
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+except ImportError:  # ijson is optional (see requirements.txt), large programs are then parsed in one go
+    ijson = None
+
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# Program files smaller than this are read directly; mmap setup costs more than it saves
+MMAP_THRESHOLD_BYTES = 64 * 1024
+
+# Program files larger than this are streamed with ijson (if installed) to bound peak memory
+STREAM_THRESHOLD_BYTES = 1_000_000
+
+# Programs with at least this many poses store joints/cartesian in a binary .npz sidecar
+NPZ_POSE_THRESHOLD = 200
+
+# Geometry shared by all pose spheres; only their pose and color differ
+POSE_SPHERE_GEOMETRY = Sphere(radius=0.02)
+
+
+@lru_cache(maxsize=32)
+def _pose_color_palette(num_poses: int) -> Tuple[Tuple[float, float, float], ...]:
+    """
+    Returns the green -> red gradient (rounded RGB tuples) for the given number of poses.
+
+    Memoized, since a redraw usually reuses the palette size of the previous one.
+    """
+    ts = np.linspace(0.0, 1.0, num_poses) if num_poses > 1 else np.zeros(num_poses)
+    colors = np.column_stack([ts, 1.0 - ts, np.zeros(num_poses)]).round(2)
+    return tuple(map(tuple, colors.tolist()))
+
 
 class PathPlanner:
     """
@@ -19,6 +61,11 @@ class PathPlanner:
     It also manages visualization of the saved pose actions using RoboMeshCat.
     """
 
+    # When True, execute_program waits for the motors on a worker thread so the animation and the
+    # preparation of the next action overlap with the wait. Off by default: strictly serial
+    # execution is the safe choice for the hardware.
+    OVERLAP_MOTOR_WAIT = False
+
     def __init__(self, filename: str = None):
         """
         Initializes the PathPlanner.
@@ -33,23 +80,55 @@ class PathPlanner:
         if filename is None:
             filename = "default_program.json"
 
+        self._path_cache: Dict[str, str] = {}  # Program filename -> full path
+        self._progs_cache: Tuple[Optional[int], Optional[List[str]]] = (None, None)  # (dir mtime_ns, program list)
         self.filename = filename
-        self.current_program_path = os.path.join(self.programs_dir, self.filename)
+        self.current_program_path = self._program_path(self.filename)
         self.program: List[Dict[str, Any]] = []  
+        self._cart_xyz = np.empty((0, 3), dtype=np.float32)  # Cartesian coordinates of the POSE actions, in order
+        self._types: List[Optional[str]] = []  # Action type per program index, parallel to self.program
+        self._wait_durations: List[int] = []  # WAIT duration (ms) per program index, -1 for other actions
+        self._pose_indices: List[int] = []  # Sorted program indices of the POSE actions
+        self._joints_cache: Optional[np.ndarray] = None  # (N, n_joints) joints of the POSE actions; None = rebuild
         self.visualized_objects: Dict[int, Object] = {}  
+        self._suspend_visualize = False  # Set by batch_updates() to defer scene updates
+        self._last_signature: Dict[int, tuple] = {}  # Program index -> (cartesian, color) shown in the scene
         self.load_program() 
 
+    def _program_path(self, filename: str) -> str:
+        """
+        Returns the full path of a program file inside the programs directory.
+
+        Args:
+            filename (str): The program filename (with .json extension).
+
+        Returns:
+            str: The full path, cached per filename.
+        """
+        path = self._path_cache.get(filename)
+        if path is None:
+            path = self._path_cache[filename] = os.path.join(self.programs_dir, filename)
+        return path
+
     def get_available_programs(self) -> List[str]:
         """
         Retrieves a list of available programs in the programs directory.
 
+        The listing is cached and only rescanned when the directory's modification time changes.
+
         Returns:
             List[str]: A sorted list of program filenames (with .json extension).
         """
         try:
-            return sorted([f for f in os.listdir(self.programs_dir) if f.endswith('.json')])
+            mtime_ns = os.stat(self.programs_dir).st_mtime_ns
+            cached_mtime, cached_programs = self._progs_cache
+            if cached_programs is not None and cached_mtime == mtime_ns:
+                return list(cached_programs)
+            programs = sorted([f for f in os.listdir(self.programs_dir) if f.endswith('.json')])
+            self._progs_cache = (mtime_ns, programs)
+            return list(programs)
         except Exception as e:
-            logger.debug(f"⚠️ Error listing programs: {e}")
+            logger.debug("⚠️ Error listing programs: %s", e)
             return []
 
     def capture_pose(self, robot) -> None:
@@ -62,50 +141,92 @@ class PathPlanner:
         current_joint_angles = robot.get_current_joint_angles()
         cartesian_coords = robot.ee_position
 
+        # Arrays are stored as-is (copied, since the robot reuses its buffers); they are
+        # serialized natively when the program is saved
         action = {
             "type": "POSE",
-            "joints": current_joint_angles.tolist(),
-            "cartesian": cartesian_coords.tolist()
+            "joints": np.array(current_joint_angles, dtype=float),
+            "cartesian": np.array(cartesian_coords, dtype=float)
         }
         self.program.append(action)
-        logger.debug(f"✅ Added Pose Action: {action}")
-        self.visualize_program_actions(robot) 
+        self._types.append("POSE")
+        self._wait_durations.append(-1)
+        self._pose_indices.append(len(self.program) - 1)
+        self._cart_xyz = np.vstack([self._cart_xyz, np.asarray(cartesian_coords, dtype=np.float32)])
+        self._joints_cache = None
+        logger.debug("✅ Added Pose Action: %s", action)
+        if not self._suspend_visualize:
+            self.visualize_program_actions(robot) 
+
+    @contextmanager
+    def batch_updates(self, robot):
+        """
+        Defers visualization while the program is edited in bulk and redraws once at the end.
+
+        Usage:
+            with planner.batch_updates(robot):
+                for _ in range(n):
+                    planner.capture_pose(robot)
+
+        Args:
+            robot: An instance of the ArctosPinocchioRobot class used for the final redraw.
+        """
+        previous = self._suspend_visualize
+        self._suspend_visualize = True
+        try:
+            yield self
+        finally:
+            self._suspend_visualize = previous
+            if not previous:
+                self.visualize_program_actions(robot)
 
-    def add_wait_action(self, duration_ms: int, robot = None) -> None:
+    def add_wait_action(self, duration_ms: int, robot = None) -> bool:
         """
         Adds a 'WAIT' action to the program.
 
         Args:
             duration_ms (int): The duration to wait in milliseconds.
             robot (Optional): Robot instance, used for re-triggering visualization if UI needs update.
+
+        Returns:
+            bool: True if the action was added, False if the duration was rejected.
         """
         if not isinstance(duration_ms, int) or duration_ms <= 0:
             logger.warning("⚠️ Invalid wait duration. Must be a positive integer (milliseconds).")
-            return
+            return False
         action = {"type": "WAIT", "duration_ms": duration_ms}
         self.program.append(action)
-        logger.debug(f"✅ Added Wait Action: {duration_ms} ms")
-        if robot: 
+        self._types.append("WAIT")
+        self._wait_durations.append(duration_ms)
+        logger.debug("✅ Added Wait Action: %s ms", duration_ms)
+        if robot and not self._suspend_visualize: 
             self.visualize_program_actions(robot) 
+        return True
 
-    def add_gripper_action(self, command: str, robot = None) -> None:
+    def add_gripper_action(self, command: str, robot = None) -> bool:
         """
         Adds a 'GRIPPER' action to the program (OPEN or CLOSE).
 
         Args:
             command (str): The gripper command, either "OPEN" or "CLOSE".
             robot (Optional): Robot instance, used for re-triggering visualization if UI needs update.
+
+        Returns:
+            bool: True if the action was added, False if the command was rejected.
         """
         valid_commands = ["OPEN", "CLOSE"]
-        cmd_upper = command.upper()
+        cmd_upper = command.upper() if isinstance(command, str) else None
         if cmd_upper not in valid_commands:
             logger.warning(f"⚠️ Invalid gripper command: {command}. Must be one of {valid_commands}.")
-            return
+            return False
         action = {"type": "GRIPPER", "command": cmd_upper}
         self.program.append(action)
-        logger.debug(f"✅ Added Gripper Action: {cmd_upper}")
-        if robot: 
+        self._types.append("GRIPPER")
+        self._wait_durations.append(-1)
+        logger.debug("✅ Added Gripper Action: %s", cmd_upper)
+        if robot and not self._suspend_visualize: 
             self.visualize_program_actions(robot)
+        return True
 
     def delete_action(self, index: int, robot) -> None:
         """
@@ -116,17 +237,22 @@ class PathPlanner:
             robot: An instance of the ArctosPinocchioRobot class for visualization updates.
         """
         if 0 <= index < len(self.program):
+            pose_row = bisect.bisect_left(self._pose_indices, index)
+            if pose_row < len(self._pose_indices) and self._pose_indices[pose_row] == index:
+                del self._pose_indices[pose_row]
+                self._cart_xyz = np.delete(self._cart_xyz, pose_row, axis=0)
+                self._joints_cache = None
+            # Actions after the deleted one move up by one
+            for i in range(pose_row, len(self._pose_indices)):
+                self._pose_indices[i] -= 1
             deleted_action = self.program.pop(index)
-            logger.debug(f"🗑️ Action {index + 1} deleted: {deleted_action}")
+            del self._types[index]
+            del self._wait_durations[index]
+            logger.debug("🗑️ Action %d deleted: %s", index + 1, deleted_action)
 
-            if index in self.visualized_objects:
-                try:
-                    robot.scene.remove_object(self.visualized_objects[index])
-                    del self.visualized_objects[index]
-                except Exception as e:
-                    logger.debug(f"⚠️ Error removing visualization for deleted action: {e}")
-            
-            self.visualize_program_actions(robot) 
+            # The visualization diff moves/recolors the shifted spheres and drops the surplus one
+            if not self._suspend_visualize:
+                self.visualize_program_actions(robot) 
         else:
             logger.warning(f"⚠️ Invalid index for deleting action: {index}")
 
@@ -134,6 +260,9 @@ class PathPlanner:
         """
         Saves the current program to a JSON file.
 
+        Programs with at least NPZ_POSE_THRESHOLD poses keep the pose arrays in a binary
+        .npz sidecar next to the JSON file, which only references it.
+
         Args:
             program_name (Optional[str]): The name of the program. If None, uses the current filename.
 
@@ -144,21 +273,327 @@ class PathPlanner:
             if not program_name.endswith(".json"):
                 program_name += ".json"
             self.filename = program_name
-            self.current_program_path = os.path.join(self.programs_dir, self.filename)
+            self.current_program_path = self._program_path(self.filename)
 
         data_to_save = {"program": self.program}  
+        # Write to a temporary file next to the target and swap it in atomically, so an
+        # interrupted save never leaves a truncated program behind
+        tmp_path = self.current_program_path + ".tmp"
+        sidecar_name = None
         try:
-            with open(self.current_program_path, 'w') as f:
-                json.dump(data_to_save, f, indent=4)
+            # The sidecar gets a fresh name, so the program file on disk keeps pointing at its old
+            # sidecar until the JSON swap below; stale sidecars are only removed after that swap
+            sidecar_name = self._write_pose_sidecar()
+            if sidecar_name is not None:
+                data_to_save = {
+                    "program": [
+                        {"type": "POSE"} if action.get("type") == "POSE" else action
+                        for action in self.program
+                    ],
+                    "pose_data": sidecar_name,
+                }
+            with open(tmp_path, 'wb') as f:
+                f.write(self._dump_program_data(data_to_save))
+            os.replace(tmp_path, self.current_program_path)
+            self._remove_stale_sidecars(keep=sidecar_name)
             logger.info(f"✅ Program '{self.filename}' saved successfully.")
             return True, f"Program '{self.filename}' saved."
         except IOError as e:
+            self._discard_tmp_file(tmp_path)
+            self._discard_new_sidecar(sidecar_name)
             logger.error(f"❌ Error saving program '{self.filename}': {e}")
             return False, f"Error saving program: {e}"
         except Exception as e:
+            self._discard_tmp_file(tmp_path)
+            self._discard_new_sidecar(sidecar_name)
             logger.error(f"❌ Unexpected error saving program '{self.filename}': {e}")
             return False, f"Unexpected error: {e}"
 
+    @staticmethod
+    def _discard_tmp_file(tmp_path: str) -> None:
+        """
+        Removes a leftover temporary file from a failed save, ignoring errors.
+
+        Args:
+            tmp_path (str): Path of the temporary file.
+        """
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+    def _sidecar_pattern(self) -> "re.Pattern[str]":
+        """
+        Returns a regex matching all .npz pose sidecars (versioned or legacy) of the current program.
+        """
+        stem = re.escape(os.path.splitext(self.filename)[0])
+        return re.compile(rf"{stem}(\.[0-9a-f]{{8}})?\.npz")
+
+    def _write_pose_sidecar(self) -> Optional[str]:
+        """
+        Writes the joints and cartesian coordinates of all POSE actions to a new .npz sidecar.
+
+        The sidecar is written under a fresh versioned name (<program>.<hex>.npz), so an existing
+        sidecar is never touched before the program file referencing the new one is in place.
+        Small programs (or poses whose joint vectors differ in length or whose cartesian
+        coordinates are invalid) stay pure JSON.
+
+        Returns:
+            Optional[str]: The new sidecar filename, or None if the program is saved as JSON only.
+        """
+        joints = None
+        if len(self._pose_indices) >= NPZ_POSE_THRESHOLD:
+            try:
+                joints = np.asarray([self.program[i]["joints"] for i in self._pose_indices], dtype=np.float64)
+            except ValueError:
+                joints = None
+
+        if joints is None or joints.ndim != 2:
+            return None
+
+        if not np.isfinite(self._cart_xyz).all():
+            return None  # Invalid cartesian entries are kept verbatim in the JSON instead
+        cartesian = np.asarray([self.program[i]["cartesian"] for i in self._pose_indices], dtype=np.float64)
+        sidecar_name = f"{os.path.splitext(self.filename)[0]}.{os.urandom(4).hex()}.npz"
+        sidecar_path = self._program_path(sidecar_name)
+        try:
+            with open(sidecar_path, 'wb') as f:
+                np.savez_compressed(f, joints=joints, cartesian=cartesian)
+        except Exception:
+            self._discard_tmp_file(sidecar_path)
+            raise
+        return sidecar_name
+
+    def _discard_new_sidecar(self, sidecar_name: Optional[str]) -> None:
+        """
+        Removes a sidecar written by a save that failed before its program file was swapped in.
+
+        Args:
+            sidecar_name (Optional[str]): The sidecar filename, or None if none was written.
+        """
+        if sidecar_name is not None:
+            self._discard_tmp_file(self._program_path(sidecar_name))
+
+    def _remove_stale_sidecars(self, keep: Optional[str]) -> None:
+        """
+        Removes the current program's sidecars other than `keep`, once the program file no longer references them.
+
+        Args:
+            keep (Optional[str]): The sidecar referenced by the freshly saved program file, if any.
+        """
+        pattern = self._sidecar_pattern()
+        try:
+            names = os.listdir(self.programs_dir)
+        except OSError as e:
+            logger.warning(f"⚠️ Could not list old pose sidecars: {e}")
+            return
+        for name in names:
+            if name != keep and pattern.fullmatch(name):
+                self._discard_tmp_file(self._program_path(name))
+
+    def _load_pose_sidecar(self, program: List[Dict[str, Any]], sidecar_name: str) -> None:
+        """
+        Fills the POSE actions of a loaded program with the arrays from its .npz sidecar.
+
+        Args:
+            program (List[Dict[str, Any]]): The loaded actions; POSE entries are updated in place.
+            sidecar_name (str): The sidecar filename referenced by the program file.
+
+        Raises:
+            ValueError: If the sidecar does not match the program's POSE actions.
+        """
+        with np.load(self._program_path(os.path.basename(sidecar_name))) as data:
+            joints, cartesian = data["joints"], data["cartesian"]
+        pose_actions = [action for action in program if action.get("type") == "POSE"]
+        if len(pose_actions) != len(joints) or len(joints) != len(cartesian):
+            raise ValueError("pose sidecar does not match the program's POSE actions")
+        for action, joints_row, cartesian_row in zip(pose_actions, joints, cartesian):
+            action["joints"] = joints_row
+            action["cartesian"] = cartesian_row
+
+    @staticmethod
+    def _dump_program_data(data: Dict[str, Any]) -> bytes:
+        """
+        Serializes program data to indented JSON bytes.
+
+        NumPy arrays stored in POSE actions are serialized natively by orjson;
+        the stdlib fallback converts them with tolist().
+
+        Args:
+            data (Dict[str, Any]): The document to serialize.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON document.
+        """
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        return json.dumps(data, indent=2, default=lambda o: o.tolist()).encode("utf-8")
+
+    def _set_program(self, program: List[Dict[str, Any]]) -> None:
+        """
+        Replaces the whole program and rebuilds the per-pose caches derived from it.
+
+        Args:
+            program (List[Dict[str, Any]]): The new list of actions.
+        """
+        self.program = program
+        self._types = [action.get("type") for action in program]
+        self._wait_durations = [
+            action.get("duration_ms", 0) if action_type == "WAIT" else -1
+            for action, action_type in zip(program, self._types)
+        ]
+        self._pose_indices = [i for i, action_type in enumerate(self._types) if action_type == "POSE"]
+        self._cart_xyz = self._pose_cartesian_rows([program[i].get("cartesian") for i in self._pose_indices])
+        pose_joints = [program[i]["joints"] for i in self._pose_indices]
+        try:
+            self._joints_cache = np.asarray(pose_joints, dtype=np.float64) if pose_joints else None
+        except ValueError:
+            # Joint lists of different lengths; _pose_joint_matrix pads/truncates them per row
+            self._joints_cache = None
+
+    @staticmethod
+    def _pose_cartesian_rows(cartesian: List[Any]) -> np.ndarray:
+        """
+        Stacks the cartesian coordinates of the POSE actions into an (N, 3) float32 array.
+
+        A missing, None or wrong-length entry does not fail the whole program: its row is
+        filled with NaN, so the rows stay aligned with _pose_indices and only that pose is
+        left out of the visualization.
+
+        Args:
+            cartesian (List[Any]): The "cartesian" value of each POSE action, in order.
+
+        Returns:
+            np.ndarray: One row per POSE action.
+        """
+        try:
+            rows = np.asarray(cartesian, dtype=np.float32)
+            if rows.shape == (len(cartesian), 3):
+                return rows
+        except (TypeError, ValueError):
+            pass
+        rows = np.full((len(cartesian), 3), np.nan, dtype=np.float32)
+        for row, value in enumerate(cartesian):
+            try:
+                rows[row] = np.asarray(value, dtype=np.float32).reshape(3)
+            except (TypeError, ValueError):
+                logger.warning(f"⚠️ POSE action {row + 1} has invalid cartesian coordinates: {value!r}")
+        return rows
+
+    def _pose_joint_matrix(self, nq: int) -> np.ndarray:
+        """
+        Returns the joints of all POSE actions as an (N, nq) array, zero-padded or truncated to nq.
+
+        Args:
+            nq (int): The robot's configuration size.
+
+        Returns:
+            np.ndarray: One row per POSE action, in program order.
+        """
+        cache = self._joints_cache
+        if cache is not None and cache.ndim == 2 and cache.shape[1] == nq:
+            return cache
+
+        matrix = np.zeros((len(self._pose_indices), nq), dtype=np.float64)
+        if cache is not None and cache.ndim == 2:
+            n = min(cache.shape[1], nq)
+            matrix[:, :n] = cache[:, :n]
+        else:
+            for row, program_idx in enumerate(self._pose_indices):
+                joints = self.program[program_idx]["joints"]
+                n = min(len(joints), nq)
+                matrix[row, :n] = joints[:n]
+        self._joints_cache = matrix
+        return matrix
+
+    @staticmethod
+    def _read_program_file(path: str) -> Any:
+        """
+        Reads and parses a program file.
+
+        Large files are memory-mapped and parsed by orjson straight from the mapping,
+        which avoids copying the whole file into an intermediate Python object first.
+        Very large files are streamed action by action with ijson when it is installed
+        (see _stream_program_file), so the raw document is never held in memory.
+
+        Args:
+            path (str): Full path of the program file.
+
+        Returns:
+            Any: The decoded JSON document.
+
+        Raises:
+            json.JSONDecodeError: If the file does not contain valid JSON.
+            ValueError: If a streamed file does not have the program file structure.
+        """
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if ijson is not None and size > STREAM_THRESHOLD_BYTES:
+                try:
+                    return PathPlanner._stream_program_file(f)
+                except ijson.JSONError as e:
+                    raise json.JSONDecodeError(str(e), "", 0) from e
+            if orjson is None:
+                return json.load(f)
+            if size < MMAP_THRESHOLD_BYTES:
+                return orjson.loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+
+    @staticmethod
+    def _stream_program_file(f) -> Dict[str, Any]:
+        """
+        Decodes a program file one action at a time with ijson.
+
+        Only the action currently being parsed exists as a generic Python object; the joints
+        and cartesian lists of each POSE are packed into float64 arrays as soon as the action
+        is complete, which is what _set_program stacks into the pose arrays afterwards.
+        Top-level scalars (such as "pose_data") are kept, other top-level keys are skipped.
+
+        Args:
+            f: The program file, opened in binary mode.
+
+        Returns:
+            Dict[str, Any]: The document with its "program" (or legacy "poses") list decoded.
+
+        Raises:
+            ValueError: If the top level is not an object or an action list contains non-objects.
+            ijson.JSONError: If the file does not contain valid JSON.
+        """
+        events = ijson.parse(f, use_float=True)
+        _, event, _ = next(events, ('', None, None))
+        if event != 'start_map':
+            raise ValueError("expected a JSON object at the top level")
+
+        document: Dict[str, Any] = {}
+        builder = None
+        for prefix, event, value in events:
+            if builder is not None:
+                builder.event(event, value)
+                if event == 'end_map' and prefix in ('program.item', 'poses.item'):
+                    action = builder.value
+                    for key in ('joints', 'cartesian'):
+                        if isinstance(action.get(key), list):
+                            try:
+                                action[key] = np.asarray(action[key], dtype=np.float64)
+                            except (TypeError, ValueError):
+                                pass  # Left as is; load_program reports invalid poses
+                    document[prefix.split('.')[0]].append(action)
+                    builder = None
+            elif prefix in ('program', 'poses'):
+                if event == 'start_array':
+                    document[prefix] = []
+                elif event != 'end_array':
+                    raise ValueError(f"'{prefix}' must be a list of actions")
+            elif prefix in ('program.item', 'poses.item'):
+                if event != 'start_map':
+                    raise ValueError(f"'{prefix.split('.')[0]}' must be a list of actions")
+                builder = ObjectBuilder()
+                builder.event(event, value)
+            elif '.' not in prefix and event in ('string', 'number', 'boolean', 'null'):
+                document[prefix] = value
+        return document
+
     def load_program(self, program_name: Optional[str] = None, robot=None) -> Tuple[bool, str]:
         """
         Loads a program from a JSON file and visualizes pose actions.
@@ -174,26 +609,39 @@ class PathPlanner:
             if not program_name.endswith(".json"):
                 program_name += ".json"
             self.filename = program_name
-            self.current_program_path = os.path.join(self.programs_dir, self.filename)
+            self.current_program_path = self._program_path(self.filename)
 
         try:
             if not os.path.exists(self.current_program_path):
                 logger.warning(f"⚠️ Program file '{self.filename}' not found. Creating new empty program.")
-                self.program = []
+                self._set_program([])
                 if robot:
                     self.visualize_program_actions(robot) 
                 return True, f"Program file '{self.filename}' not found. New program started."
 
-            with open(self.current_program_path, 'r') as f:
-                loaded_data = json.load(f)
-                if "poses" in loaded_data and "program" not in loaded_data:
-                    logger.info(f"📝 Converting old program format for '{self.filename}'.")
-                    self.program = [
-                        {"type": "POSE", "joints": pose.get("joints"), "cartesian": pose.get("cartesian")}
-                        for pose in loaded_data.get("poses", [])
-                    ]
-                else:
-                    self.program = loaded_data.get("program", [])
+            loaded_data = self._read_program_file(self.current_program_path)
+            if not isinstance(loaded_data, dict):
+                raise ValueError("expected a JSON object at the top level")
+            if "poses" in loaded_data and "program" not in loaded_data:
+                logger.info(f"📝 Converting old program format for '{self.filename}'.")
+                self._set_program([
+                    {"type": "POSE", "joints": pose.get("joints"), "cartesian": pose.get("cartesian")}
+                    for pose in loaded_data.get("poses", [])
+                ])
+            else:
+                program = loaded_data.get("program", [])
+                # Only spot-check the first action; scanning every entry is O(N) for large programs
+                if not isinstance(program, list) or (program and not isinstance(program[0], dict)):
+                    raise ValueError("'program' must be a list of actions")
+                if "pose_data" in loaded_data:
+                    self._load_pose_sidecar(program, loaded_data["pose_data"])
+                self._set_program(program)
+
+            # Validate all POSE joints in one vectorized pass instead of per action
+            if self._joints_cache is not None and (
+                self._joints_cache.ndim != 2 or not np.isfinite(self._joints_cache).all()
+            ):
+                raise ValueError("POSE joints must be finite vectors of equal length")
             
             logger.info(f"✅ Program '{self.filename}' loaded. {len(self.program)} actions.")
             if robot:
@@ -201,17 +649,45 @@ class PathPlanner:
             return True, f"Program '{self.filename}' loaded."
         except json.JSONDecodeError as e:
             logger.error(f"❌ Error decoding JSON from '{self.filename}': {e}")
-            self.program = []
+            self._set_program([])
             if robot:
                 self.visualize_program_actions(robot)
             return False, f"Error decoding program file: {e}"
+        except ValueError as e:
+            logger.error(f"❌ Invalid program structure in '{self.filename}': {e}")
+            self._set_program([])
+            if robot:
+                self.visualize_program_actions(robot)
+            return False, f"Invalid program file: {e}"
         except Exception as e:
             logger.error(f"❌ Unexpected error loading '{self.filename}': {e}")
-            self.program = []
+            self._set_program([])
             if robot:
                 self.visualize_program_actions(robot)
             return False, f"Unexpected error: {e}"
 
+    @staticmethod
+    def _clamp_per_joint(values: list[int] | int, upper: int, name: str) -> list[int]:
+        """
+        Broadcasts a scalar or per-joint value to the 6 joints and clamps it to [0, upper].
+
+        Args:
+            values (list[int] | int): A global value or one value per joint.
+            upper (int): The inclusive upper bound.
+            name (str): Parameter name used in the error message.
+
+        Returns:
+            list[int]: Six clamped values, rounded to the nearest integer.
+
+        Raises:
+            ValueError: If a sequence with a length other than 6 is given.
+        """
+        arr = np.asarray(values)
+        if arr.ndim != 0 and arr.shape != (6,):
+            raise ValueError(f"{name} must have length 6")
+        # Round rather than truncate, so e.g. an acceleration of 0.9 does not become 0
+        return np.rint(np.clip(np.broadcast_to(arr, (6,)), 0, upper)).astype(np.int32).tolist()
+
     def execute_program( 
             self,
             robot,
@@ -232,44 +708,59 @@ class PathPlanner:
             logger.warning("⚠️ No program loaded or program is empty.")
             return
 
-        if isinstance(speeds, int):
-            speed_list = [max(0, min(speeds, 3000))] * 6
-        else:
-            if len(speeds) != 6:
-                raise ValueError("speeds must have length 6")
-            speed_list = [max(0, min(s, 3000)) for s in speeds]
+        speed_list = self._clamp_per_joint(speeds, 3000, "speeds")
+        acceleration_list = self._clamp_per_joint(acceleration, 255, "acceleration")
 
-        if isinstance(acceleration, int):
-            acceleration_list = [max(0, min(acceleration, 255))] * 6
-        else:
-            if len(acceleration) != 6:
-                raise ValueError("acceleration must have length 6")
-            acceleration_list = [max(0, min(a, 255)) for a in acceleration]
+        # Joints of all POSE actions, converted and zero-padded to nq once for the whole run
+        pose_joints = self._pose_joint_matrix(robot.model.nq)
+        pose_row = 0
+
+        # Joint-limit check for every POSE at once
+        within_limits = robot.check_joint_limits_batch(pose_joints)
+
+        # The pending motor wait is always joined before the next hardware command or WAIT,
+        # so overlapping never sends a move while the previous one is still running
+        wait_executor = ThreadPoolExecutor(max_workers=1) if self.OVERLAP_MOTOR_WAIT else None
+        pending_wait: Optional[Future] = None
+
+        def finish_pending_wait() -> None:
+            nonlocal pending_wait
+            if pending_wait is not None:
+                wait, pending_wait = pending_wait, None
+                wait.result()
 
         logger.info(f"▶️ Starting program execution: '{self.filename}'")
-        for idx, action in enumerate(self.program):
-            action_type = action.get("type")
-            logger.debug(f"🔹 Executing Action {idx + 1}/{len(self.program)}: Type={action_type}, Details={action}")
+        # Dispatch on the parallel type/duration lists; the action dicts are only read for GRIPPER
+        for idx, (action_type, duration_ms) in enumerate(zip(self._types, self._wait_durations)):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("🔹 Executing Action %d/%d: Type=%s, Details=%s", idx + 1, len(self.program), action_type, self.program[idx])
 
             try:
+                if action_type != "POSE":
+                    finish_pending_wait()
+
                 if action_type == "POSE":
-                    q_target = np.asarray(action["joints"])
-                    if len(q_target) < robot.model.nq:
-                        missing = robot.model.nq - len(q_target)
-                        q_target = np.concatenate((q_target, np.zeros(missing)))
+                    q_target = pose_joints[pose_row]
+                    pose_ok = within_limits[pose_row]
+                    pose_row += 1
 
-                    if not robot.check_joint_limits(q_target):
+                    if not pose_ok:
+                        robot.check_joint_limits(q_target)  # Logs the per-joint violations
                         logger.warning(f"Action {idx + 1} (POSE) violates joint limits – skipped.")
                         continue
 
-                    robot.set_joint_angles_animated(q_target, duration=1.0, steps=15)
-                    
-                    angles_rad_for_hw = q_target.tolist()[:6] 
+                    # Start the hardware move first so the simulation animation runs while the motors move
+                    angles_rad_for_hw = q_target[:6].tolist()
+                    finish_pending_wait()
                     arctos.move_to_angles(angles_rad_for_hw, speeds=speed_list, acceleration=acceleration_list)
-                    arctos.wait_for_motors_to_stop()
+                    if wait_executor is not None:
+                        pending_wait = wait_executor.submit(arctos.wait_for_motors_to_stop)
+                    # The robot keeps a reference to its target configuration, so hand over a copy
+                    robot.set_joint_angles_animated(q_target.copy(), duration=1.0, steps=15)
+                    if wait_executor is None:
+                        arctos.wait_for_motors_to_stop()
 
                 elif action_type == "WAIT":
-                    duration_ms = action.get("duration_ms", 0)
                     duration_s = duration_ms / 1000.0
                     if duration_s > 0:
                         logger.info(f"⏳ Waiting for {duration_s:.2f} seconds...")
@@ -278,7 +769,7 @@ class PathPlanner:
                         logger.warning(f"⚠️ Invalid wait duration for action {idx + 1}: {duration_ms} ms")
                 
                 elif action_type == "GRIPPER":
-                    command = action.get("command")
+                    command = self.program[idx].get("command")
                     if command == "OPEN":
                         logger.info("🤖 Opening gripper...")
                         arctos.open_gripper()
@@ -296,8 +787,28 @@ class PathPlanner:
             except Exception as e:
                 logger.error(f"❌ Error executing action {idx + 1} ({action_type}): {e}")
 
+        if wait_executor is not None:
+            try:
+                finish_pending_wait()
+            except Exception as e:
+                logger.error(f"❌ Error waiting for the final move to finish: {e}")
+            wait_executor.shutdown(wait=True)
+
         logger.info(f"✅ Program '{self.filename}' execution completed.")
 
+    def get_pose_label(self, index: int) -> str:
+        """
+        Builds a human-readable label for the POSE action at the given program index.
+
+        Args:
+            index (int): The index of the POSE action in the program.
+
+        Returns:
+            str: A label containing the action number and its rounded Cartesian coordinates.
+        """
+        x, y, z = np.round(np.asarray(self.program[index]["cartesian"], dtype=float), 3)
+        return f"PoseAction {index + 1} | x={x} y={y} z={z}"
+
     def visualize_program_actions(self, robot) -> None: 
         """
         Visualizes the 'POSE' actions from the current program in the RoboMeshCat scene.
@@ -306,40 +817,55 @@ class PathPlanner:
         Args:
             robot: An instance of the ArctosPinocchioRobot class.
         """
-        for obj_idx in list(self.visualized_objects.keys()): 
+        num_pose_actions = len(self._pose_indices)
+
+        # Green -> red gradient over the display order, shared by all redraws with this many poses
+        colors = _pose_color_palette(num_pose_actions)
+
+        # Only touch the scene where something changed: spheres whose program index is gone are
+        # removed, existing spheres are moved/recolored in place and only new indices are added
+        # Poses without valid cartesian coordinates (NaN rows) get no sphere
+        finite_rows = np.isfinite(self._cart_xyz).all(axis=1).tolist()
+        new_signature = {
+            original_program_idx: (tuple(self._cart_xyz[visual_order_idx].tolist()), colors[visual_order_idx])
+            for visual_order_idx, original_program_idx in enumerate(self._pose_indices)
+            if finite_rows[visual_order_idx]
+        }
+
+        for obj_idx in [idx for idx in self.visualized_objects if idx not in new_signature]:
             try:
                 robot.scene.remove_object(self.visualized_objects[obj_idx])
-                del self.visualized_objects[obj_idx]
             except Exception as e:
-                logger.debug(f"Error removing old visual object for index {obj_idx}: {e}")
-        self.visualized_objects.clear()
-
-        pose_actions_with_indices = [
-            (original_idx, action) 
-            for original_idx, action in enumerate(self.program) 
-            if action.get("type") == "POSE"
-        ]
-        num_pose_actions = len(pose_actions_with_indices)
-
-        for visual_order_idx, (original_program_idx, action) in enumerate(pose_actions_with_indices):
+                logger.debug("Error removing old visual object for index %s: %s", obj_idx, e)
+            del self.visualized_objects[obj_idx]
+            self._last_signature.pop(obj_idx, None)
+
+        for original_program_idx, (cartesian, color) in new_signature.items():
+            old_signature = self._last_signature.get(original_program_idx)
+            if old_signature == (cartesian, color) and original_program_idx in self.visualized_objects:
+                continue
             try:
-                cartesian = np.array(action["cartesian"])
-                rounded = np.round(cartesian, 3)
-
-                t = visual_order_idx / max(1, num_pose_actions - 1) if num_pose_actions > 1 else 0
-                color = [round(1.0 * t, 2), round(1.0 - t, 2), 0.0]  
-
-                name = f"PoseAction {original_program_idx+1} (Display {visual_order_idx+1}) | x={rounded[0]} y={rounded[1]} z={rounded[2]}"
-
-                sphere = Object.create_sphere(
-                    radius=0.02,
-                    name=name,
-                    color=color,
-                    opacity=0.8
-                )
-                robot.scene.add_object(sphere)
-                sphere.pos = cartesian
-                self.visualized_objects[original_program_idx] = sphere 
-
+                sphere = self.visualized_objects.get(original_program_idx)
+                if sphere is not None and old_signature is not None:
+                    if old_signature[0] != cartesian:
+                        sphere.pos = cartesian
+                    if old_signature[1] != color:
+                        sphere.color = list(color)
+                else:
+                    # Short, stable scene path; use get_pose_label() for a human-readable description.
+                    # The pose is passed to the constructor so add_object() sends geometry and
+                    # transform together instead of a separate position update per sphere.
+                    sphere_pose = np.eye(4)
+                    sphere_pose[:3, 3] = cartesian
+                    sphere = Object(
+                        POSE_SPHERE_GEOMETRY,
+                        pose=sphere_pose,
+                        name=f"pose_{original_program_idx}",
+                        color=list(color),
+                        opacity=0.8
+                    )
+                    robot.scene.add_object(sphere)
+                    self.visualized_objects[original_program_idx] = sphere
+                self._last_signature[original_program_idx] = (cartesian, color)
             except Exception as e:
                 logger.warning(f"⚠️ Error visualizing POSE action at original_program_idx {original_program_idx}: {e}")
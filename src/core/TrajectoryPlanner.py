@@ -1,12 +1,17 @@
 import numpy as np
 import time
 import logging
-import threading
-from typing import List, Union, Any
+from concurrent.futures import ThreadPoolExecutor
+import warnings
+from typing import List, Optional, Union, Any
+from ._kernels import build_cos_traj, compute_factors, scale_and_clamp
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
+# move_linear_joints_smooth(num_steps=...) is deprecated; warn only on the first use
+_num_steps_warned = False
+
 
 class TrajectoryPlanner:
     """
@@ -26,6 +31,7 @@ class TrajectoryPlanner:
     TARGET_ANGULAR_RESOLUTION_RAD = np.deg2rad(1.0)  # Desired ~1.0 deg change per step
     MIN_TRAJ_STEPS = 10  # Min steps for any trajectory
     MAX_TRAJ_STEPS = 75  # Max steps to cap trajectory duration
+    ENCODER_DEADBAND = 5  # Skip re-sending an axis target that moved fewer encoder counts than this
     
     def __init__(self, robot: Any, controller: Any) -> None:
         """
@@ -37,6 +43,23 @@ class TrajectoryPlanner:
         """
         self.robot = robot
         self.controller = controller
+        # Joint limits of the 6 arm joints, cached once for all limit checks
+        self._q_lo = np.asarray(robot.lower_limits[:6], dtype=np.float64)
+        self._q_hi = np.asarray(robot.upper_limits[:6], dtype=np.float64)
+        # Persistent workers for the per-waypoint servo commands. Each command blocks for at least
+        # 0.1 s waiting for the servo's ack while waypoints go out every MIN_TIME_STEP, so several
+        # waypoints are in flight at once; size the pool so they never queue behind each other.
+        waypoints_in_flight = int(np.ceil(0.1 / self.MIN_TIME_STEP)) + 1
+        self._pool = ThreadPoolExecutor(max_workers=6 * waypoints_in_flight, thread_name_prefix="servo")
+
+    def close(self) -> None:
+        """Shut down the servo command thread pool."""
+        self._pool.shutdown(wait=True)
+
+    def __del__(self):
+        """Clean up resources when the object is destroyed."""
+        if hasattr(self, "_pool"):
+            self._pool.shutdown(wait=False)
         
     def _validate_joint_angles(self, current_angles: np.ndarray, target_angles: np.ndarray) -> bool:
         """Validate joint angles before planning trajectory."""
@@ -47,62 +70,82 @@ class TrajectoryPlanner:
             )
             return False
             
-        if not self.robot.check_joint_limits(target_angles):
+        if not self._within_limits(target_angles)[0]:
+            self.robot.check_joint_limits(target_angles)  # Logs the per-joint violations
             logger.error(f"Target joint configuration {np.rad2deg(target_angles)} violates joint limits.")
             return False
             
         return True
+
+    def _within_limits(self, q: np.ndarray) -> np.ndarray:
+        """Vectorized limit check of one or more configurations (first 6 joints); returns a mask per row."""
+        q_arm = np.atleast_2d(q)[:, :6]
+        return ((q_arm >= self._q_lo) & (q_arm <= self._q_hi)).all(axis=1)
     
     def _calculate_speed_factors(self, joint_deltas: np.ndarray) -> np.ndarray:
         """Calculate speed factors based on joint deltas for smooth motion."""
-        max_delta = np.max(joint_deltas) if np.max(joint_deltas) > 1e-6 else 1.0
-        normalized_deltas = joint_deltas / max_delta
-        return np.maximum(np.power(normalized_deltas, 0.8), 0.5)  # power=0.8, min_speed=0.5
+        # power=0.8, min_speed=0.5
+        return compute_factors(np.ascontiguousarray(joint_deltas, dtype=np.float64))
     
     def _calculate_speeds(self, 
                          speed_factors: np.ndarray, 
                          base_speed: Union[int, float, List[float], np.ndarray],
                          speed_boost: float = 1.5) -> List[int]:
         """Calculate individual joint speeds based on base speed and factors."""
-        if isinstance(base_speed, (int, float)):
-            base_speed_scalar = base_speed * speed_boost
-            return [min(self.MAX_JOINT_SPEED, int(base_speed_scalar * factor)) 
-                   for factor in speed_factors]
-                    
-        if isinstance(base_speed, (list, np.ndarray)) and len(base_speed) == len(speed_factors):
-            return [min(self.MAX_JOINT_SPEED, int(float(s) * speed_boost * speed_factors[i])) 
-                   for i, s in enumerate(base_speed)]
-                   
-        logger.warning("Invalid joint_speed format. Using default scaled base speed for all joints.")
-        return [min(self.MAX_JOINT_SPEED, int(500 * speed_boost * factor)) 
-               for factor in speed_factors]
+        base = self._as_joint_values(base_speed, len(speed_factors))
+        if base is None:
+            logger.warning("Invalid joint_speed format. Using default scaled base speed for all joints.")
+            base = np.float64(500)
+
+        # A scalar applies to all joints; the kernel truncates like int()
+        if base.ndim == 0:
+            base = np.full(len(speed_factors), base)
+        return scale_and_clamp(base, speed_boost, speed_factors, self.MAX_JOINT_SPEED).tolist()
     
     def _calculate_accelerations(self, 
                                speed_factors: np.ndarray, 
                                base_accel: Union[int, float, List[float], np.ndarray],
                                accel_boost: float = 1.3) -> List[int]:
         """Calculate individual joint accelerations based on base acceleration and factors."""
-        if isinstance(base_accel, (int, float)):
-            base_accel_scalar = min(self.MAX_JOINT_ACCELERATION, int(base_accel * accel_boost))
-            return [min(self.MAX_JOINT_ACCELERATION, int(base_accel_scalar * factor)) 
-                   for factor in speed_factors]
-                    
-        if isinstance(base_accel, (list, np.ndarray)) and len(base_accel) == len(speed_factors):
-            return [min(self.MAX_JOINT_ACCELERATION, int(float(a) * accel_boost * speed_factors[i])) 
-                   for i, a in enumerate(base_accel)]
-                   
-        logger.warning("Invalid joint_acceleration format. Using default scaled base acceleration.")
-        return [min(self.MAX_JOINT_ACCELERATION, int(150 * accel_boost * factor)) 
-               for factor in speed_factors]
+        base = self._as_joint_values(base_accel, len(speed_factors))
+        if base is None:
+            logger.warning("Invalid joint_acceleration format. Using default scaled base acceleration.")
+            base, boost = np.full(len(speed_factors), 150.0), accel_boost
+        elif base.ndim == 0:
+            # A global acceleration is boosted and clamped once before the per-joint scaling
+            scaled = min(self.MAX_JOINT_ACCELERATION, int(base * accel_boost))
+            base, boost = np.full(len(speed_factors), float(scaled)), 1.0
+        else:
+            boost = accel_boost
+
+        return scale_and_clamp(base, boost, speed_factors, self.MAX_JOINT_ACCELERATION).tolist()
+
+    @staticmethod
+    def _as_joint_values(values: Any, num_joints: int) -> Union[np.ndarray, None]:
+        """Convert a scalar or per-joint value to a float array; None if the format is invalid."""
+        try:
+            arr = np.asarray(values, dtype=np.float64)
+        except (TypeError, ValueError):
+            return None
+        if arr.ndim == 0 or arr.shape == (num_joints,):
+            return arr
+        return None
     
     def _generate_smooth_trajectory(self, 
                                   start_angles: np.ndarray, 
-                                  target_angles: np.ndarray) -> List[np.ndarray]:
-        """Generate smooth trajectory using cosine interpolation with adaptive step count."""
+                                  target_angles: np.ndarray) -> np.ndarray:
+        """Generate smooth trajectory using cosine interpolation with adaptive step count.
+
+        Returns an (N, n_joints) array with one waypoint per row.
+        """
         max_joint_delta = np.max(np.abs(target_angles - start_angles))
         
         if max_joint_delta < 1e-6: # Very small or no movement
-            return [start_angles.copy(), target_angles.copy()]
+            return np.stack([start_angles, target_angles])
+
+        if max_joint_delta < 2 * self.TARGET_ANGULAR_RESOLUTION_RAD:
+            # Small jog: one direct command, the servo's own acceleration ramp keeps it smooth
+            return np.array(target_angles, dtype=np.float64, ndmin=2)
 
         num_interpolated_steps = int(np.ceil(max_joint_delta / self.TARGET_ANGULAR_RESOLUTION_RAD))
         
@@ -113,55 +156,74 @@ class TrajectoryPlanner:
         # This typically applies if MIN_TRAJ_STEPS is very low or max_joint_delta is tiny.
         actual_steps = max(actual_steps, 2)
 
-        trajectory = []
-        for i in range(actual_steps):
-            t_raw = i / (actual_steps - 1) # t_raw goes from 0 to 1
-            # Apply cosine interpolation for smooth start and stop (ease-in, ease-out)
-            t = 0.5 - 0.5 * np.cos(t_raw * np.pi)
-            interpolated_joints = start_angles * (1 - t) + target_angles * t
-            trajectory.append(interpolated_joints)
-            
-        return trajectory
+        # Cosine interpolation for smooth start and stop (ease-in, ease-out), all steps at once
+        return build_cos_traj(
+            np.ascontiguousarray(start_angles, dtype=np.float64),
+            np.ascontiguousarray(target_angles, dtype=np.float64),
+            actual_steps,
+        )
     
     def _execute_joint_movement(self, 
-                              joint_configs: List[np.ndarray],
+                              joint_configs: np.ndarray,
                               speeds: List[int],
                               accelerations: List[int],
                               joint_deltas: np.ndarray) -> bool:
         """Execute the planned joint movement through the controller."""
         servos = self.controller.servos
+
+        # Check every waypoint against the joint limits before commanding any of them
+        within_limits = self._within_limits(joint_configs)
+        if not within_limits.all():
+            i = int(np.argmin(within_limits))
+            self.robot.check_joint_limits(joint_configs[i])  # Logs the per-joint violations
+            logger.error(f"Joint limits violated at trajectory point {i} for "
+                       f"config {np.rad2deg(joint_configs[i])}. Aborting.")
+            return False
+
+        # Convert the whole trajectory to encoder values once instead of per joint and waypoint
+        encoders_all = self.controller.angles_to_encoders(joint_configs[:, :6])
         
+        # Loop invariants bound to locals once instead of re-resolved on every waypoint
+        moving = joint_deltas[:encoders_all.shape[1]] > 1e-4
+        deadband = self.ENCODER_DEADBAND
+        dt = self.MIN_TIME_STEP
+        monotonic = time.monotonic
+        last_sent = None
+        last_index = len(joint_configs) - 1
+        deadline = None
         for i, joint_config in enumerate(joint_configs):
             # Log progress periodically
-            if i % 10 == 0: 
+            if i % 10 == 0 and logger.isEnabledFor(logging.DEBUG):
                 logger.debug(f"Moving to waypoint {i+1}/{len(joint_configs)}: "
                            f"{np.rad2deg(joint_config)}")
             
-            # Check joint limits at each waypoint before commanding
-            if not self.robot.check_joint_limits(joint_config):
-                logger.error(f"Joint limits violated at trajectory point {i} for "
-                           f"config {np.rad2deg(joint_config)}. Aborting.")
-                return False
-            
-            # Convert joint angles to encoder values
-            angles_rad = joint_config.tolist()[:6]
-            encoder_values = [
-                self.controller.angle_to_encoder(angle, j_idx) 
-                for j_idx, angle in enumerate(angles_rad)
-            ]
+            encoder_row = encoders_all[i]
+            # Drop per-axis frames whose target barely changed; the final waypoint is always sent
+            if last_sent is None or i == last_index:
+                send_mask = moving
+            else:
+                send_mask = moving & (np.abs(encoder_row - last_sent) >= deadband)
+            last_sent = encoder_row if last_sent is None else np.where(send_mask, encoder_row, last_sent)
+            encoder_values = encoder_row.tolist()
+
+            # Pace waypoints on a fixed MIN_TIME_STEP grid so a late tick is caught up by the next
+            # ones instead of shifting the rest of the trajectory; resync only when far behind
+            if deadline is not None:
+                now = monotonic()
+                if now - deadline > 5 * dt:
+                    deadline = now
+                elif now < deadline:
+                    time.sleep(deadline - now)
             
-            # Move each joint in a separate thread
+            # Move each joint on the servo thread pool
             self._move_joints_concurrently(
                 encoder_values, 
                 speeds, 
                 accelerations, 
-                joint_deltas, 
+                send_mask.tolist(), 
                 servos
             )
-            
-            # Add small delay between waypoints (except the last one)
-            if i < len(joint_configs) - 1:
-                time.sleep(self.MIN_TIME_STEP)
+            deadline = (monotonic() if deadline is None else deadline) + dt
         
         return True
     
@@ -169,29 +231,24 @@ class TrajectoryPlanner:
                                 encoder_values: List[float],
                                 speeds: List[int],
                                 accelerations: List[int],
-                                joint_deltas: np.ndarray,
+                                send_mask: List[bool],
                                 servos: list) -> None:
-        """Start commands to move all joints concurrently using threads. Does not wait for completion."""
-        threads = []
-        for j_idx, (enc_val, spd, acc) in enumerate(zip(encoder_values, speeds, accelerations)):
-            # Only move joints that need significant movement and have valid servo
-            if j_idx < len(servos) and joint_deltas[j_idx] > 1e-4:
-                thread = threading.Thread(
-                    target=servos[j_idx].run_motor_absolute_motion_by_axis,
-                    args=(spd, acc, enc_val)
-                )
-                threads.append(thread)
-                thread.start()
+        """Start commands to move all joints concurrently on the servo thread pool. Does not wait for completion."""
+        submit = self._pool.submit
+        n_servos = len(servos)
+        for j_idx, (enc_val, spd, acc, send) in enumerate(zip(encoder_values, speeds, accelerations, send_mask)):
+            # Only move joints whose target changed enough and that have a valid servo
+            if send and j_idx < n_servos:
+                submit(servos[j_idx].run_motor_absolute_motion_by_axis, spd, acc, enc_val)
                 
-        # Wait for all threads to complete
-        # Threads are intentionally not joined here.
+        # Futures are intentionally not awaited here.
         # The time.sleep in _execute_joint_movement provides pacing.
         # wait_for_motors_to_stop() at the end of the main public method
         # ensures overall motion completion.
     
     def move_linear_joints_smooth(self, 
                                 target_joint_angles: np.ndarray, 
-                                num_steps: int = 20, 
+                                num_steps: Optional[int] = None, 
                                 joint_speed: Union[int, List[int], np.ndarray] = 500, 
                                 joint_acceleration: Union[int, List[int], np.ndarray] = 150) -> bool:
         """
@@ -203,8 +260,8 @@ class TrajectoryPlanner:
         
         Args:
             target_joint_angles: Target joint angles in radians (typically for first 6 joints).
-            num_steps: Number of intermediate steps for interpolation. More steps result
-                     in smoother but slower motion.
+            num_steps: Deprecated and ignored. The step count is derived from the largest
+                     joint delta (see TARGET_ANGULAR_RESOLUTION_RAD).
             joint_speed: Base speed for joint movements (controller-specific units, 0-3000).
                        Can be a scalar or a list for individual joint speeds.
             joint_acceleration: Base acceleration for joint movements (0-255).
@@ -213,7 +270,19 @@ class TrajectoryPlanner:
         Returns:
             bool: True if movement was successful, False otherwise.
         """
+        if num_steps is not None:
+            global _num_steps_warned
+            if not _num_steps_warned:
+                _num_steps_warned = True
+                warnings.warn(
+                    "move_linear_joints_smooth(num_steps=...) is ignored and will be removed",
+                    DeprecationWarning,
+                    stacklevel=2,
+                )
+
         try:
+            # q_encoder is only kept current while a control page streams live encoder updates
+            # (see utils.stream_encoder_labels); with none open it holds the last reading
             current_joint_angles = self.robot.q_encoder[:6]  # Assuming first 6 are controllable
             
             # Validate inputs
@@ -231,7 +300,7 @@ class TrajectoryPlanner:
             speeds = self._calculate_speeds(speed_factors, joint_speed, speed_boost=1.5)
             accelerations = self._calculate_accelerations(speed_factors, joint_acceleration, accel_boost=1.3)
             
-            # Generate smooth trajectory (num_steps is no longer used here)
+            # Generate smooth trajectory (step count adapts to the move size)
             joint_configs = self._generate_smooth_trajectory(
                 current_joint_angles, 
                 target_joint_angles
@@ -0,0 +1,56 @@
+"""
+Numeric kernels shared by the core motion code.
+
+The functions are compiled with Numba when it is installed. Numba is optional: without it
+the decorator is a no-op and the same code runs as plain NumPy. All kernels live in this one
+module so they are compiled (or loaded from Numba's on-disk cache) once per process.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional, run the kernels as plain NumPy
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def compute_factors(joint_deltas: np.ndarray) -> np.ndarray:
+    """Per-joint speed factors: deltas normalized to the largest one, ^0.8, at least 0.5."""
+    max_delta = np.max(joint_deltas)
+    if max_delta <= 1e-6:
+        max_delta = 1.0
+    return np.maximum(np.power(joint_deltas / max_delta, 0.8), 0.5)
+
+
+@njit(cache=True)
+def scale_and_clamp(base: np.ndarray, boost: float, factors: np.ndarray, max_value: int) -> np.ndarray:
+    """Computes base * boost * factors per joint, truncated to int64 and clamped to max_value."""
+    return np.minimum(max_value, (base * boost * factors).astype(np.int64))
+
+
+@njit(cache=True)
+def build_cos_traj(start: np.ndarray, target: np.ndarray, steps: int) -> np.ndarray:
+    """Cosine-eased (steps, n_joints) interpolation from start to target."""
+    t = 0.5 - 0.5 * np.cos(np.linspace(0.0, np.pi, steps))
+    return np.outer(1.0 - t, start) + np.outer(t, target)
+
+
+def warm_up() -> None:
+    """
+    Calls every kernel once with representative 6-joint inputs.
+
+    With Numba this triggers compilation (or loads the cached machine code) at startup,
+    so the first real motion does not pay the JIT cost. Without Numba it is a no-op.
+    """
+    if not NUMBA_AVAILABLE:
+        return
+    zeros = np.zeros(6)
+    factors = compute_factors(zeros)
+    scale_and_clamp(zeros, 1.0, factors, 1)
+    build_cos_traj(zeros, zeros, 2)
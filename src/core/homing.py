@@ -5,8 +5,11 @@ This module provides functions to home the robot axes and move them into a safe
 Homing zero positions are entirely determined by offsets saved in settings (no hardcoded base zeros).
 """
 import logging
-from typing import Any, Dict
-import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
 
 from utils.settings_manager import SettingsManager
 
@@ -18,38 +21,112 @@ logger.setLevel(logging.INFO)
 MOTOR_IDS = [1, 2, 3, 4, 5, 6]
 
 # Base homing sequence for independent mode (all axes)
-BASE_HOMING_SEQUENCE = list(reversed(MOTOR_IDS))
-
-# Homing sequence that will be used (can be modified based on settings)
-HOMING_SEQUENCE = list(BASE_HOMING_SEQUENCE)  # Default to all axes
+BASE_HOMING_SEQUENCE = tuple(reversed(MOTOR_IDS))
 
-# Predefined sleep positions for each axis (raw units)
+# Predefined sleep positions for each axis (raw units), indexed like arctos.servos: SLEEP_POSITIONS[axis - 1]
 # TODO: Set appropriate sleep positions as needed
-SLEEP_POSITIONS: Dict[int, int] = {axis: 0 for axis in MOTOR_IDS}
+SLEEP_POSITIONS = np.zeros(len(MOTOR_IDS), dtype=np.int32)
+SLEEP_POSITIONS.flags.writeable = False
 
 
-def update_homing_sequence(settings_manager: SettingsManager) -> None:
+@lru_cache(maxsize=2)
+def get_homing_sequence(coupled_mode: bool) -> Tuple[int, ...]:
     """
-    Update the HOMING_SEQUENCE based on the current settings.
+    Return the axes to home, in order (joint 6 to 1).
     If coupled_axis_mode is enabled, only axes 1-4 will be homed.
+
+    Args:
+        coupled_mode: Value of the "coupled_axis_mode" setting.
+
+    Returns:
+        Tuple[int, ...]: 1-based axis numbers in homing order.
     """
-    global HOMING_SEQUENCE
-    coupled_mode = settings_manager.get("coupled_axis_mode", False)
     if coupled_mode:
-        HOMING_SEQUENCE = [axis for axis in BASE_HOMING_SEQUENCE if axis <= 4]
-        logger.info("Coupled B/C axis mode detected. Homing only axes 1-4.")
-    else:
-        HOMING_SEQUENCE = list(BASE_HOMING_SEQUENCE)
+        return tuple(axis for axis in BASE_HOMING_SEQUENCE if axis <= 4)
+    return BASE_HOMING_SEQUENCE
+
+
+def get_homing_groups(sequence: Tuple[int, ...], parallel: bool) -> List[List[int]]:
+    """
+    Split a homing sequence into groups of axes that are moved at the same time.
+
+    The wrist axes (5 and 6) are always moved on their own and first; with parallel homing
+    the remaining arm axes (1-4) share one group. Without it every axis is its own group,
+    which reproduces the strictly sequential order.
+
+    Args:
+        sequence: Axes in homing order, see get_homing_sequence().
+        parallel: Whether independent axes may be homed concurrently.
+
+    Returns:
+        List[List[int]]: Groups of 1-based axis numbers, in execution order.
+    """
+    if not parallel:
+        return [[axis] for axis in sequence]
+    groups = [[axis] for axis in sequence if axis >= 5]
+    arm_axes = [axis for axis in sequence if axis <= 4]
+    if arm_axes:
+        groups.append(arm_axes)
+    return groups
+
+
+def build_homing_plan(settings_manager: SettingsManager,
+                      sequence: Tuple[int, ...]) -> Dict[int, Tuple[int, int, int, int]]:
+    """
+    Resolve the per-axis homing parameters from the settings once, before any axis moves.
+
+    Args:
+        settings_manager: SettingsManager instance for offsets, speeds and accelerations.
+        sequence: Axes in homing order, see get_homing_sequence().
+
+    Returns:
+        Dict[int, Tuple[int, int, int, int]]: (axis, offset, speed, accel) per axis in the sequence.
+    """
+    values = settings_manager.get_many(("homing_offsets", "joint_speeds", "joint_acceleration"))
+    offsets = values["homing_offsets"] or {}
+    speeds = values["joint_speeds"] or {}
+    accelerations = values["joint_acceleration"] or {}
+    return {
+        axis: (axis, offsets.get(axis - 1, 0), speeds.get(axis - 1, 500), accelerations.get(axis - 1, 150))
+        for axis in sequence
+    }
+
+
+def _run_homing_groups(settings_manager: SettingsManager,
+                       sequence: Tuple[int, ...],
+                       move_axis: Callable[[int, int, int, int], None]) -> None:
+    """
+    Run move_axis(axis, offset, speed, accel) for every axis, group by group; axes within a
+    group run concurrently.
+
+    Each group is finished before the next starts. If any axis fails, axes of its group that
+    have not started yet are cancelled, the running ones still finish and the error is re-raised.
+    """
+    plan = build_homing_plan(settings_manager, sequence)
+    for group in get_homing_groups(sequence, settings_manager.get("parallel_homing", False)):
+        if len(group) == 1:
+            move_axis(*plan[group[0]])
+            continue
+        with ThreadPoolExecutor(max_workers=len(group), thread_name_prefix="homing") as pool:
+            futures = [pool.submit(move_axis, *plan[axis]) for axis in group]
+            done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in pending:
+                future.cancel()
+        for future in futures:
+            if future.done() and not future.cancelled():
+                future.result()
+
 
 def move_to_zero_pose(arctos: Any, settings_manager: SettingsManager) -> None:
     """
     Perform the homing routine for all axes in reverse order (joint 6 to 1):
-    1. Update the homing sequence based on current settings
+    1. Derive the homing sequence from the current settings
     2. Move to the home switch via built-in b_go_home().
     3. Move to the configured zero position (offset) from settings.
     4. Set the current axis position to zero in software.
 
     Note: In coupled B/C axis mode, only axes 1-4 will be homed.
+    Note: With the "parallel_homing" setting, axes 1-4 are homed concurrently after 6 and 5.
 
     Args:
         arctos: Robot controller instance providing servo control methods.
@@ -60,55 +137,41 @@ def move_to_zero_pose(arctos: Any, settings_manager: SettingsManager) -> None:
     """
     logger.info("Starting homing process for all axes (6->1) using settings offsets")
 
-    # Update homing sequence based on current settings and get coupled mode status
-    update_homing_sequence(settings_manager)
+    # Derive the homing sequence from the coupled mode setting
     coupled_mode = settings_manager.get("coupled_axis_mode", False)
+    sequence = get_homing_sequence(coupled_mode)
     
     # Log warning if in coupled mode
     if coupled_mode:
+        logger.info("Coupled B/C axis mode detected. Homing only axes 1-4.")
         logger.warning("Coupled B/C axis mode is enabled. Axes 5 and 6 will not be homed automatically.")
     
     # Initialize homing offsets if not present
-    offsets = settings_manager.get("homing_offsets", {})
-    if not offsets:
-        offsets = {axis: 0 for axis in MOTOR_IDS}
-        settings_manager.set("homing_offsets", offsets)
-    
-    # Get speeds and accelerations
-    speeds = settings_manager.get("joint_speeds", {})
-    accelerations = settings_manager.get("joint_acceleration", {})
+    if not settings_manager.get("homing_offsets", {}):
+        settings_manager.set("homing_offsets", {axis: 0 for axis in MOTOR_IDS})
 
-    for axis in HOMING_SEQUENCE:
+    def home_axis(axis: int, user_offset: int, speed: int, accel: int) -> None:
         try:
             servo = arctos.servos[axis - 1]
-            axis_id = axis - 1  # 0-based index for servos
-
-            # Get the user-specified offset (default to 0 if not set)
-            user_offset = offsets.get(axis_id, 0)
-            
-            # Get speed and acceleration with defaults
-            speed = speeds.get(axis_id, 500)
-            accel = accelerations.get(axis_id, 150)
 
             logger.info(
                 f"Homing axis {axis}: offset={user_offset}, speed={speed}, accel={accel}"
             )
 
             # 1) Home the motor (this resets the encoder to 0)
-            logger.debug(f"Axis {axis}: Moving to home switch...")
+            logger.debug("Axis %s: Moving to home switch...", axis)
             servo.b_go_home()
-            arctos.wait_for_motors_to_stop()
-            
-            # Small delay to ensure motor has stopped completely
-            time.sleep(0.1)
+            arctos.wait_for_motors_to_stop(axis=axis)
+            # Short bounded settle check instead of a fixed delay
+            arctos.wait_until_idle(axis, timeout=0.5)
             
             # 2) Move to the user-specified offset position
             if user_offset != 0:
-                logger.debug(f"Axis {axis}: Moving to offset position {user_offset}...")
+                logger.debug("Axis %s: Moving to offset position %s...", axis, user_offset)
                 # Use relative motion from the current position (which should be 0 after homing)
                 servo.run_motor_relative_motion_by_axis(speed, accel, int(user_offset))
-                arctos.wait_for_motors_to_stop()
-                time.sleep(0.1)  # Small delay
+                arctos.wait_for_motors_to_stop(axis=axis)
+                arctos.wait_until_idle(axis, timeout=0.5)
 
             # 3) Set the current position as the zero reference
             servo.set_current_axis_to_zero()
@@ -118,6 +181,9 @@ def move_to_zero_pose(arctos: Any, settings_manager: SettingsManager) -> None:
             logger.error(f"Error homing axis {axis}: {e}", exc_info=True)
             raise  # Re-raise to stop the homing process if any axis fails
 
+    # Parameters for all axes are resolved up front; any failing axis stops the homing process
+    _run_homing_groups(settings_manager, sequence, home_axis)
+
     logger.info("All axes have been homed using settings offsets.")
 
 
@@ -126,6 +192,7 @@ def move_to_sleep_pose(arctos: Any, settings_manager: SettingsManager) -> None:
     Move all axes to a safe sleep pose in reverse order (joint 6 to 1):
     - For axes 4-6: Move to home switch and then to zero position offset
     - For axes 1-3: Just move to home switch
+    With the "parallel_homing" setting, axes 1-4 move concurrently after 6 and 5.
 
     Args:
         arctos: Robot controller instance.
@@ -135,38 +202,29 @@ def move_to_sleep_pose(arctos: Any, settings_manager: SettingsManager) -> None:
         None
     """
     logger.info("Moving to sleep pose for all axes (6->1)")
+    sequence = get_homing_sequence(settings_manager.get("coupled_axis_mode", False))
 
-    # Retrieve settings for speeds and accelerations
-    speeds: Dict[int, int] = settings_manager.get("joint_speeds", {})
-    accelerations: Dict[int, int] = settings_manager.get("joint_acceleration", {})
-    offsets = settings_manager.get("homing_offsets", {})
-
-    for axis in HOMING_SEQUENCE:
+    def sleep_axis(axis: int, user_offset: int, speed: int, accel: int) -> None:
         try:
-            axis_id = axis - 1  # 0-based index
-            servo = arctos.servos[axis_id]
-
-            # Get speed and acceleration with defaults
-            speed = speeds.get(axis_id, 500)
-            accel = accelerations.get(axis_id, 150)
+            servo = arctos.servos[axis - 1]
 
             logger.info(f"Moving axis {axis} to sleep pose...")
 
             # 1) Move to home switch first (this resets the encoder to 0)
-            logger.debug(f"Axis {axis}: Moving to home switch...")
+            logger.debug("Axis %s: Moving to home switch...", axis)
             servo.b_go_home()
-            arctos.wait_for_motors_to_stop()
-            time.sleep(0.1)  # Small delay
+            arctos.wait_for_motors_to_stop(axis=axis)
+            # Short bounded settle check instead of a fixed delay
+            arctos.wait_until_idle(axis, timeout=0.5)
 
             # 2) For axes 4-6, move to zero position offset
             if axis >= 4:  # Axes 4, 5, 6
-                user_offset = offsets.get(axis_id, 0)
                 if user_offset != 0:
-                    logger.debug(f"Axis {axis}: Moving to zero position offset {user_offset}...")
+                    logger.debug("Axis %s: Moving to zero position offset %s...", axis, user_offset)
                     # Use relative motion from home position (which should be 0 after homing)
                     servo.run_motor_relative_motion_by_axis(speed, accel, int(user_offset))
-                    arctos.wait_for_motors_to_stop()
-                    time.sleep(0.1)  # Small delay
+                    arctos.wait_for_motors_to_stop(axis=axis)
+                    arctos.wait_until_idle(axis, timeout=0.5)
 
             logger.info(f"Axis {axis} moved to sleep position")
 
@@ -174,4 +232,7 @@ def move_to_sleep_pose(arctos: Any, settings_manager: SettingsManager) -> None:
             logger.error(f"Error moving axis {axis} to sleep pose: {e}", exc_info=True)
             raise  # Re-raise to stop the process if any axis fails
 
+    # Speeds, accelerations and offsets for all axes are resolved up front
+    _run_homing_groups(settings_manager, sequence, sleep_axis)
+
     logger.info("All axes have reached sleep pose.")
@@ -0,0 +1,69 @@
+"""
+File: core/services.py
+
+This module provides lazily constructed, process-wide instances of the core components.
+
+Every getter builds its component on the first call and returns the same instance afterwards,
+so the URDF is parsed and the CAN bus is opened exactly once, no matter how many modules ask
+for them.
+"""
+import logging
+from functools import lru_cache
+
+from utils.settings_manager import SettingsManager
+from .ArctosController import ArctosController
+from .ArctosPinocchio import ArctosPinocchioRobot
+from .CanBusManager import CanBusManager
+from .PathPlanner import PathPlanner
+from .TrajectoryPlanner import TrajectoryPlanner
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+
+@lru_cache(maxsize=1)
+def get_settings_manager() -> SettingsManager:
+    """Return the shared SettingsManager."""
+    settings_manager = SettingsManager()
+    logger.info("⚙️ Settings Manager initialized")
+    return settings_manager
+
+
+@lru_cache(maxsize=1)
+def get_can_bus_manager() -> CanBusManager:
+    """Return the shared CanBusManager."""
+    can_bus_manager = CanBusManager()
+    logger.info("CAN Bus initialized")
+    return can_bus_manager
+
+
+@lru_cache(maxsize=1)
+def get_arctos() -> ArctosController:
+    """Return the shared ArctosController, opening the CAN bus on first use."""
+    arctos = ArctosController(can_bus_manager=get_can_bus_manager(), settings_manager=get_settings_manager())
+    logger.info("🤖 Arctos Controller initialized")
+    return arctos
+
+
+@lru_cache(maxsize=1)
+def get_robot() -> ArctosPinocchioRobot:
+    """Return the shared ArctosPinocchioRobot, parsing the URDF on first use."""
+    robot = ArctosPinocchioRobot()
+    logger.info("🦾 Arctos Pinocchio Robot initialized")
+    return robot
+
+
+@lru_cache(maxsize=1)
+def get_path_planner() -> PathPlanner:
+    """Return the shared PathPlanner."""
+    planner = PathPlanner()
+    logger.info("🗺️ Path Planner initialized")
+    return planner
+
+
+@lru_cache(maxsize=1)
+def get_trajectory_planner() -> TrajectoryPlanner:
+    """Return the shared TrajectoryPlanner for the shared robot model and controller."""
+    trajectory_planner = TrajectoryPlanner(get_robot(), get_arctos())
+    logger.info("trajectory_planner initialized")
+    return trajectory_planner
@@ -12,38 +12,44 @@ from pages import home, mks_config
 from pages.settings import set_page
 from pages.control import ctrl_page
 from components.menu import create_menu
-from core.ArctosController import ArctosController
-from core.PathPlanner import PathPlanner
-from core.TrajectoryPlanner import TrajectoryPlanner
-from core.CanBusManager import CanBusManager
-from core.ArctosPinocchio import ArctosPinocchioRobot  # Import for robot kinematics
-from utils.settings_manager import SettingsManager  # Import to manage settings
+from core import services
+from core._kernels import warm_up as warm_up_kernels
+from concurrent.futures import Future, ThreadPoolExecutor
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-# Initialize core logic components and settings
-settings_manager = SettingsManager()  # Initialize the settings manager
-
-logger.info("⚙️ Settings Manager initialized")
+# Initialize core logic components and settings through the shared service getters
+settings_manager = services.get_settings_manager()  # Initialize the settings manager
 
 try:
-    can_bus_manager = CanBusManager()
-    logger.info("CAN Bus initialized")
-    Arctos = ArctosController(can_bus_manager=can_bus_manager, settings_manager=settings_manager)  # Initialize the robot controller
-    logger.info("🤖 Arctos Controller initialized")
-    robot = ArctosPinocchioRobot()  # Initialize the robot kinematics
-    logger.info("🦾 Arctos Pinocchio Robot initialized")
-    planner = PathPlanner()  # Initialize the path planner
-    logger.info("🗺️ Path Planner initialized")
-    trajectory_planner = TrajectoryPlanner(robot, Arctos)  # Initialize the trajectory planner
-    logger.info("trajectory_planner initialized")
+    Arctos = services.get_arctos()  # Initialize the CAN bus and the robot controller
 except Exception as e:
     logger.error(f"❌ Error initializing core components: {e}")
     raise
 
 
+def _log_startup_error(future: Future) -> None:
+    """Report a failed background initialization as soon as it happens."""
+    if future.exception() is not None:
+        logger.error(f"❌ Error initializing core components: {future.exception()}")
+
+
+# Parsing the URDF, setting up the path planner and compiling the kernels take a while; do it in
+# the background so the web server can start serving pages immediately. Pages that need them
+# await the futures.
+startup_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="startup")
+robot_future = startup_pool.submit(services.get_robot)  # Initialize the robot kinematics
+planner_future = startup_pool.submit(services.get_path_planner)  # Initialize the path planner
+# Compile (or load from cache) the Numba trajectory kernels before the first motion; no-op without Numba
+kernels_future = startup_pool.submit(warm_up_kernels)
+for _future in (robot_future, planner_future, kernels_future):
+    _future.add_done_callback(_log_startup_error)
+startup_pool.shutdown(wait=False)
+
+
 # Apply global settings like theme (Dark/Light Mode)
 if settings_manager.get("theme") == "Dark":
     ui.dark_mode().enable()  # Enable dark mode
@@ -60,10 +66,12 @@ def home_page():
     home.create()
 
 @ui.page('/control')
-def control_page():
+async def control_page():
     """Creates and displays the robot control page.
     This page allows to control the robot.
     """
+    robot, planner = await asyncio.gather(asyncio.wrap_future(robot_future), asyncio.wrap_future(planner_future))
+    trajectory_planner = services.get_trajectory_planner()  # Cheap once the robot model exists
     create_menu()
     ctrl_page.create(Arctos, robot, planner, settings_manager, trajectory_planner)
 
@@ -1,7 +1,11 @@
-from nicegui import ui
+from concurrent.futures import ThreadPoolExecutor
+from nicegui import run, ui
 from core import homing
 import utils.utils as utils
-from threading import Thread
+import asyncio
+
+# Reserved for the emergency stop so it never queues behind homing/sleep moves on NiceGUI's shared pool
+_emergency_stop_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="emergency-stop")
 
 def home_button(Arctos, settings_manager):
     """Create a button to home the robot.
@@ -13,10 +17,9 @@ def home_button(Arctos, settings_manager):
     Returns:
         None. The function builds the UI directly using NiceGUI components.
     """
-    def run_homing():
-        homing.move_to_zero_pose(Arctos, settings_manager)
-    return ui.button("\U0001F3E0 Move to Home Pose", 
-                   on_click=lambda: Thread(target=run_homing, daemon=True).start()) \
+    async def run_homing():
+        await run.io_bound(homing.move_to_zero_pose, Arctos, settings_manager)
+    return ui.button("\U0001F3E0 Move to Home Pose", on_click=run_homing) \
         .tooltip("Send robot to predefined 'home' configuration") \
         .classes('bg-purple-500 text-white px-4 py-2 rounded-lg shadow hover:bg-purple-700')
 
@@ -30,10 +33,9 @@ def sleep_button(Arctos, settings_manager):
     Returns:
         None. The function builds the UI directly using NiceGUI components.
     """
-    def run_sleep_pose():
-        homing.move_to_sleep_pose(Arctos, settings_manager)
-    return ui.button("\U0001F634 Move to Sleep Pose",
-                   on_click=lambda: Thread(target=run_sleep_pose, daemon=True).start()) \
+    async def run_sleep_pose():
+        await run.io_bound(homing.move_to_sleep_pose, Arctos, settings_manager)
+    return ui.button("\U0001F634 Move to Sleep Pose", on_click=run_sleep_pose) \
         .tooltip("Send robot to safe resting position (sleep pose)") \
         .classes('bg-gray-500 text-white px-4 py-2 rounded-lg shadow hover:bg-gray-700')
 
@@ -74,9 +76,12 @@ def emergency_stop_button(Arctos):
     Returns:
         None. The function builds the UI directly using NiceGUI components.
     """
+    async def run_emergency_stop():
+        # Reading the motor speeds blocks on the CAN bus; keep the event loop (and this button) responsive
+        await asyncio.wrap_future(_emergency_stop_executor.submit(Arctos.safe_emergency_stop))
     return ui.button(
         "\U0001F6D1 EMERGENCY STOP",
-        on_click=lambda: Arctos.safe_emergency_stop()
+        on_click=run_emergency_stop
     ).tooltip(
         "Emergency stop: If any motor is above 1000 RPM, decelerate rapidly; otherwise, stop instantly. Use ONLY in case of emergency!"
     ).classes('bg-gray-700 text-white px-4 py-2 rounded-lg')
@@ -1,3 +1,4 @@
+import asyncio
 from nicegui import ui
 import numpy as np
 from nicegui.events import KeyEventArguments
@@ -11,6 +12,18 @@ from .visualization_keyboard import visualization_keyboard
 from .live_joint_states import live_joint_states
 from utils import utils
 
+# Pose label refresh: fast while the joints move, slow once they have been still for a few ticks
+POSE_REFRESH_MOVING_S = 0.1
+POSE_REFRESH_IDLE_S = 1.0
+POSE_IDLE_TICKS = 4
+
+# Reports tab visibility changes (Page Visibility API) to the server as a 'page_visibility' event
+PAGE_VISIBILITY_JS = """
+<script>
+document.addEventListener('visibilitychange', () => emitEvent('page_visibility', !document.hidden));
+</script>
+"""
+
 def create(Arctos, robot, planner, settings_manager, trajectory_planner):
     """Assembles the complete control page by composing modular sections.
 
@@ -27,8 +40,12 @@ def create(Arctos, robot, planner, settings_manager, trajectory_planner):
     Raises:
         None.
     """
+    # Settings used while building the page, read once
+    theme = settings_manager.get("theme")
+    live_joint_updates = settings_manager.get("enable_live_joint_updates", True)
+
     # Theme
-    if settings_manager.get("theme") == "Dark":
+    if theme == "Dark":
         ui.dark_mode().enable()
     else:
         ui.dark_mode().disable()
@@ -48,13 +65,15 @@ def create(Arctos, robot, planner, settings_manager, trajectory_planner):
         ui.notify(f'Speed scale set to {int(val*100)} %', color='positive')
         
     # Initialize joint positions for encoder
-    joint_positions_encoder = live_joint_states(settings_manager)
+    joint_positions_encoder = live_joint_states(settings_manager) if live_joint_updates else [None] * 6
     
     # Create a container for the entire page
     with ui.element('div').classes('w-full h-screen fixed inset-0'):
         # 1. Background iframe with full pointer events
-        ui.html(f'''<iframe src="{robot.meshcat_url}" style="width: 100%; height: 100%; border: none;"></iframe>''')\
-                .classes('absolute inset-0 w-full h-full')
+        # A real iframe element: only its src prop is sent instead of an inline HTML string
+        ui.element('iframe').props(f'src="{robot.meshcat_url}"') \
+            .style('width: 100%; height: 100%; border: none;') \
+            .classes('absolute inset-0 w-full h-full')
 
         # 2. Top control buttons (sticky header) - positioned below menu bar
         with ui.element('div').classes('absolute top-[56px] left-0 right-0 z-10'):
@@ -80,10 +99,10 @@ def create(Arctos, robot, planner, settings_manager, trajectory_planner):
                     speed_scale(settings_manager, apply_speed)
                     
                     # Joint control section
-                    joint_positions = joint_control(robot)
+                    joint_positions, joint_expansion = joint_control(robot)
                     
                     # End effector control section
-                    ee_position_labels, ee_orientation_labels = end_effector_control(robot)
+                    ee_position_labels, ee_orientation_labels, ee_expansion = end_effector_control(robot)
                     
                     # Gripper control section
                     gripper_control(Arctos, robot)
@@ -95,10 +114,76 @@ def create(Arctos, robot, planner, settings_manager, trajectory_planner):
                     step_size_slider = None
                     visualization_keyboard(robot, Arctos, step_size_slider, settings_manager)
         
+    # Track whether the browser tab is visible; live updates are paused while it is hidden
+    page_visible = {'value': True}
+
     # Timers
-    ui.timer(0.25, lambda: utils.update_joint_states(robot, joint_positions))
-    ui.timer(0.25, lambda: utils.live_update_ee_postion(robot, ee_position_labels))
-    ui.timer(0.25, lambda: utils.live_update_ee_orientation(robot, ee_orientation_labels))
-    if settings_manager.get("enable_live_joint_updates", True):
-        # A single timer now handles both fetching hardware data and updating the UI for maximum efficiency.
-        ui.timer(0.02, lambda: utils.update_robot_joint_states_async(robot, Arctos, settings_manager, joint_positions_encoder))
+    def refresh_joint_labels():
+        utils.update_pose_labels(robot, joint_positions=joint_positions)
+
+    def refresh_ee_labels():
+        utils.update_pose_labels(robot, ee_position_labels=ee_position_labels,
+                                 ee_orientation_labels=ee_orientation_labels)
+
+    motion = {'q_prev': np.array(robot.q[:6], dtype=float), 'still_ticks': 0}
+
+    def refresh_pose_labels():
+        # Adapt the refresh rate to joint motion: poll fast while moving, slowly while at rest
+        q = np.array(robot.q[:6], dtype=float)
+        if np.max(np.abs(q - motion['q_prev'])) > 1e-4:
+            motion['still_ticks'] = 0
+            pose_timer.interval = POSE_REFRESH_MOVING_S
+        else:
+            motion['still_ticks'] += 1
+            if motion['still_ticks'] >= POSE_IDLE_TICKS:
+                pose_timer.interval = POSE_REFRESH_IDLE_S
+        motion['q_prev'] = q
+
+        # One tick refreshes joints and end effector from one state snapshot; collapsed sections are skipped
+        show_ee = ee_expansion.value
+        utils.update_pose_labels(
+            robot,
+            joint_positions=joint_positions if joint_expansion.value else None,
+            ee_position_labels=ee_position_labels if show_ee else None,
+            ee_orientation_labels=ee_orientation_labels if show_ee else None,
+        )
+
+    # Timers start stopped and only run while their labels can actually be seen
+    pose_timer = ui.timer(POSE_REFRESH_MOVING_S, refresh_pose_labels, active=False)
+    # Encoder labels are pushed by the shared encoder reader while this task runs (no timer)
+    encoder_stream = {'task': None}
+
+    def set_encoder_stream(enabled):
+        task = encoder_stream['task']
+        if enabled and task is None:
+            encoder_stream['task'] = asyncio.create_task(
+                utils.stream_encoder_labels(robot, Arctos, settings_manager, joint_positions_encoder)
+            )
+        elif not enabled and task is not None:
+            task.cancel()
+            encoder_stream['task'] = None
+
+    def sync_timers():
+        pose_timer.active = page_visible['value'] and (joint_expansion.value or ee_expansion.value)
+        set_encoder_stream(live_joint_updates and page_visible['value'])
+
+    def on_expansion_change(e, refresh):
+        # Refresh right away when a section is opened instead of waiting for the next tick
+        if e.args:
+            refresh()
+        sync_timers()
+
+    def on_visibility_change(e):
+        page_visible['value'] = bool(e.args)
+        sync_timers()
+
+    joint_expansion.on('update:model-value', lambda e: on_expansion_change(e, refresh_joint_labels))
+    ee_expansion.on('update:model-value', lambda e: on_expansion_change(e, refresh_ee_labels))
+    ui.add_body_html(PAGE_VISIBILITY_JS)
+    ui.on('page_visibility', on_visibility_change)
+
+    # Stop pushing to this page while its browser is gone, resume when it reconnects
+    client = ui.context.client
+    client.on_disconnect(lambda: set_encoder_stream(False))
+    client.on_connect(sync_timers)
+    sync_timers()
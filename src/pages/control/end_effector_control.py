@@ -10,7 +10,8 @@ def end_effector_control(robot):
         robot: The robot instance whose end-effector is being controlled.
 
     Returns:
-        tuple: Tuple of (position_labels, orientation_labels) as NiceGUI label objects.
+        tuple: Tuple of (position_labels, orientation_labels, expansion): the NiceGUI label objects
+            and the expansion containing them, so callers can skip updates while it is collapsed.
     """
     # --- Modern End-Effector Control Expansion ---
     expansion_common = (
@@ -18,7 +19,7 @@ def end_effector_control(robot):
         "rounded-md shadow-xl p-0 transition-all duration-300 "
         "hover:shadow-2xl"
     )
-    with ui.expansion('End-Effector Control', icon='open_with', value=False).classes(expansion_common).props('expand-icon="expand_more"'):
+    with ui.expansion('End-Effector Control', icon='open_with', value=False).classes(expansion_common).props('expand-icon="expand_more"') as expansion:
         # --- Live Readout Row ---
         with ui.column().classes('w-full gap-y-2 items-center'):
             with ui.row().classes('gap-2 mb-4 flex-wrap items-center justify-center'):
@@ -34,71 +35,60 @@ def end_effector_control(robot):
             mode = ui.toggle(["Position Only", "Position + Orientation", "Orientation Only"], value="Position + Orientation") \
                 .classes('max-w-fit')
         # --- Inputs Area ---
-        ee_position_inputs = {axis: None for axis in ["X", "Y", "Z"]}
-        ee_orientation_inputs = {axis: None for axis in ["Roll", "Pitch", "Yaw"]}
+        # All six inputs are built once; switching modes only shows/hides the rows, so typed values are kept
+        ee_position_inputs = {}
+        ee_orientation_inputs = {}
         input_container = ui.element('div').classes('w-full')
+        with input_container:
+            with ui.row().classes('gap-4 w-full mb-2 justify-center') as position_row:
+                for axis in ["X", "Y", "Z"]:
+                    ee_position_inputs[axis] = ui.number(label=f"{axis} (m)", format="%.3f").props('dense') \
+                        .tooltip(f"Target {axis} coordinate in meters.") \
+                        .classes('w-32 rounded border-blue-200')
+            with ui.row().classes('gap-4 w-full mb-2 justify-center') as orientation_row:
+                for axis in ["Roll", "Pitch", "Yaw"]:
+                    ee_orientation_inputs[axis] = ui.number(label=f"{axis} (°)", format="%.1f").props('dense') \
+                        .tooltip(f"Target {axis} angle in degrees.") \
+                        .classes('w-32 rounded border-purple-200')
         def update_inputs():
-            # Clear and re-create input fields based on mode
-            nonlocal ee_position_inputs, ee_orientation_inputs
-            input_container.clear()
-            for axis in ["X", "Y", "Z"]:
-                ee_position_inputs[axis] = None
-            for axis in ["Roll", "Pitch", "Yaw"]:
-                ee_orientation_inputs[axis] = None
-            if mode.value in ("Position Only", "Position + Orientation"):
-                with input_container:
-                    with ui.row().classes('gap-4 w-full mb-2 justify-center'):
-                        for axis in ["X", "Y", "Z"]:
-                            ee_position_inputs[axis] = ui.number(label=f"{axis} (m)", format="%.3f").props('dense') \
-                                .tooltip(f"Target {axis} coordinate in meters.") \
-                                .classes('w-32 rounded border-blue-200')
-            if mode.value in ("Position + Orientation", "Orientation Only"):
-                with input_container:
-                    with ui.row().classes('gap-4 w-full mb-2 justify-center'):
-                        for axis in ["Roll", "Pitch", "Yaw"]:
-                            ee_orientation_inputs[axis] = ui.number(label=f"{axis} (°)", format="%.1f").props('dense') \
-                                .tooltip(f"Target {axis} angle in degrees.") \
-                                .classes('w-32 rounded border-purple-200')
-        # Initial input render
+            # Show the input rows that belong to the selected mode
+            position_row.set_visibility(mode.value in ("Position Only", "Position + Orientation"))
+            orientation_row.set_visibility(mode.value in ("Position + Orientation", "Orientation Only"))
+        # Initial input visibility
         update_inputs()
-        # Re-render on mode change
-        mode.on('update:model-value', lambda e: update_inputs())
         # Place the container in the UI
         input_container.move()
         # --- Action Buttons ---
         last_action_label = ui.label("").classes('block mt-2 text-sm text-gray-600')
-        def set_pose():
-            try:
-                utils.set_ee_pose_from_input(robot, ee_position_inputs, ee_orientation_inputs, True)
-                last_action_label.set_text("✅ End-Effector moved to position and orientation.")
-                last_action_label.classes('text-green-700')
-            except Exception as e:
-                last_action_label.set_text(f"❌ {str(e)}")
-                last_action_label.classes('text-red-700')
-        def set_position():
+        last_action_ok = {'value': None}  # Colour currently applied to the label (None = neutral)
+        def show_last_action(text, ok):
+            last_action_label.set_text(text)
+            # Swap the colour class only when the outcome changes; .classes() appends otherwise
+            if last_action_ok['value'] != ok:
+                last_action_label.classes(add='text-green-700' if ok else 'text-red-700',
+                                          remove='text-red-700' if ok else 'text-green-700')
+                last_action_ok['value'] = ok
+        def run_action(action, ok_msg):
+            # Shared by all three buttons: run the move and report the outcome on the status label
             try:
-                utils.set_ee_position_from_input(robot, ee_position_inputs)
-                last_action_label.set_text("✅ End-Effector moved to position.")
-                last_action_label.classes('text-green-700')
+                action()
+                show_last_action(ok_msg, True)
             except Exception as e:
-                last_action_label.set_text(f"❌ {str(e)}")
-                last_action_label.classes('text-red-700')
-        def set_orientation():
-            try:
-                utils.set_ee_orientation_from_input(robot, ee_orientation_inputs)
-                last_action_label.set_text("✅ End-Effector orientation updated.")
-                last_action_label.classes('text-green-700')
-            except Exception as e:
-                last_action_label.set_text(f"❌ {str(e)}")
-                last_action_label.classes('text-red-700')
+                show_last_action(f"❌ {str(e)}", False)
         with ui.row().classes('gap-4 w-full mt-4 justify-center'):
-            btn_pos = ui.button("📍 Set Position", on_click=set_position) \
+            btn_pos = ui.button("📍 Set Position", on_click=lambda: run_action(
+                lambda: utils.set_ee_position_from_input(robot, ee_position_inputs),
+                "✅ End-Effector moved to position.")) \
                 .tooltip("Move to XYZ position only (keeps orientation).") \
                 .classes('bg-blue-600 text-white px-4 py-2 rounded-lg shadow hover:bg-blue-800')
-            btn_pose = ui.button("🚀 Set Position + Orientation", on_click=set_pose) \
+            btn_pose = ui.button("🚀 Set Position + Orientation", on_click=lambda: run_action(
+                lambda: utils.set_ee_pose_from_input(robot, ee_position_inputs, ee_orientation_inputs, True),
+                "✅ End-Effector moved to position and orientation.")) \
                 .tooltip("Move to XYZ + RPY using inverse kinematics.") \
                 .classes('bg-teal-600 text-white px-4 py-2 rounded-lg shadow hover:bg-teal-800')
-            btn_ori = ui.button("🎯 Set Orientation Only", on_click=set_orientation) \
+            btn_ori = ui.button("🎯 Set Orientation Only", on_click=lambda: run_action(
+                lambda: utils.set_ee_orientation_from_input(robot, ee_orientation_inputs),
+                "✅ End-Effector orientation updated.")) \
                 .tooltip("Update only orientation (RPY) at current position.") \
                 .classes('bg-purple-700 text-white px-4 py-2 rounded-lg shadow hover:bg-purple-900')
             # Show/hide buttons based on mode
@@ -107,8 +97,12 @@ def end_effector_control(robot):
                 btn_pose.set_visibility(mode.value == "Position + Orientation")
                 btn_ori.set_visibility(mode.value == "Orientation Only")
             update_button_visibility()
-            mode.on('update:model-value', lambda e: update_button_visibility())
+        # One handler updates inputs and buttons together on mode change
+        def on_mode_change(e):
+            update_inputs()
+            update_button_visibility()
+        mode.on('update:model-value', on_mode_change)
         # --- Last Action Status ---
         last_action_label.set_text("")
     # --- End Modern End-Effector Control Card ---
-    return ee_position_labels, ee_orientation_labels
+    return ee_position_labels, ee_orientation_labels, expansion
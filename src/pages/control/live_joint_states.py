@@ -1,5 +1,14 @@
 from nicegui import ui
 
+# Captions, classes and styles are built once at import instead of on every page load
+_JOINT_CAPTIONS = tuple(f'J{i+1}' for i in range(6))
+_CAPTION_CLS = 'text-xs text-blue-800 -mb-1'
+_CAPTION_STYLE = 'width: 100%; text-align: center;'
+_COLUMN_STYLE = 'width: 64px; min-width: 64px; max-width: 64px;'
+_VALUE_PLACEHOLDER = '--.--°'
+_VALUE_CLS = 'text-sm font-mono text-blue-800 bg-gray-50/80 rounded px-2 py-1 min-w-[65px] max-w-[65px] text-center border border-gray-200 shadow-sm'
+_VALUE_STYLE = 'width: 70px; display: inline-block; text-align: center;'
+
 def live_joint_states(settings_manager):
     """Render the live joint states UI section if enabled in settings.
 
@@ -16,13 +25,11 @@ def live_joint_states(settings_manager):
         with ui.row().classes('items-center gap-3 w-full px-2').style('width: 100%; height: 100%;'):
             ui.icon('sensors', size='sm').classes('text-blue-600')
             joint_positions_encoder = []
-            for i in range(6):
-                with ui.column().classes('items-center').style('width: 64px; min-width: 64px; max-width: 64px;'):
-                    ui.label(f'J{i+1}').classes('text-xs text-blue-800 -mb-1').style('width: 100%; text-align: center;')
+            for caption in _JOINT_CAPTIONS:
+                with ui.column().classes('items-center').style(_COLUMN_STYLE):
+                    ui.label(caption).classes(_CAPTION_CLS).style(_CAPTION_STYLE)
                     joint_positions_encoder.append(
-                        ui.label('--.--°').classes(
-                            'text-sm font-mono text-blue-800 bg-gray-50/80 rounded px-2 py-1 min-w-[65px] max-w-[65px] text-center border border-gray-200 shadow-sm'
-                        ).style('width: 70px; display: inline-block; text-align: center;')
+                        ui.label(_VALUE_PLACEHOLDER).classes(_VALUE_CLS).style(_VALUE_STYLE)
                     )
 
     return joint_positions_encoder
@@ -48,11 +48,12 @@ def speed_scale(settings_manager, apply_speed):
                 return f"{int(round(num * 100))} %"
             except Exception:
                 return "-- %"
+        # Dragging emits a value per pixel; throttle client-side and only send the latest value per 50 ms
         speed_slider.on('update:model-value', lambda e: [
             speed_input.set_value(e.args),
             speed_display.set_text(safe_percent(e.args))
-        ])
+        ], throttle=0.05, leading_events=False)
         speed_input.on('update:model-value', lambda e: [
             speed_slider.set_value(e.args),
             speed_display.set_text(safe_percent(e.args))
-        ])
+        ], throttle=0.05, leading_events=False)
@@ -49,6 +49,8 @@ def visualization_keyboard(robot, Arctos, step_size_slider=None, settings_manage
     def handle_key(e: KeyEventArguments):
         if not keyboard_control_enabled['value']:
             return
+        if e.action.repeat:
+            return
         key = e.key.name
         if key not in key_map:
             return
@@ -58,8 +60,6 @@ def visualization_keyboard(robot, Arctos, step_size_slider=None, settings_manage
             pressed_keys.discard(key)
 
     def process_simulation_keys():
-        if not keyboard_control_enabled['value']:
-            return
         if not pressed_keys:
             return
         step = step_size_slider.value if step_size_slider else 0.002
@@ -85,8 +85,6 @@ def visualization_keyboard(robot, Arctos, step_size_slider=None, settings_manage
             ui.notify(f"IK failed: {ex}", color="red")
 
     def process_hardware_keys():
-        if not keyboard_control_enabled['value']:
-            return
         if not pressed_keys:
             return
         if not (settings_manager and settings_manager.get("keyboard_send_to_robot", False)):
@@ -126,10 +124,14 @@ def visualization_keyboard(robot, Arctos, step_size_slider=None, settings_manage
         except Exception as ex:
             ui.notify(f"IK failed: {ex}", color="red")
 
-    # Add NiceGUI keyboard event tracking
-    keyboard = ui.keyboard(on_key=handle_key)
-    ui.timer(0.1, process_simulation_keys)
-    ui.timer(0.1, process_hardware_keys)
+    # Add NiceGUI keyboard event tracking; only keydown/keyup matter for the pressed-key set,
+    # so the browser is told not to send OS auto-repeat events at all
+    keyboard = ui.keyboard(on_key=handle_key, repeating=False)
+    # The key processing timers only run while keyboard control is enabled
+    key_timers = (
+        ui.timer(0.1, process_simulation_keys, active=False),
+        ui.timer(0.1, process_hardware_keys, active=False),
+    )
 
 
 
@@ -216,8 +218,20 @@ def visualization_keyboard(robot, Arctos, step_size_slider=None, settings_manage
                     step=1
                 ).props('label-always').classes('w-56')
 
-        def handle_keyboard_switch(val: bool):
+        def set_keyboard_active(val: bool) -> bool:
+            """Set the keyboard control state; returns True only if it actually changed."""
+            if keyboard_control_enabled['value'] == val:
+                return False
             keyboard_control_enabled['value'] = val
+            # Key-ups are ignored while disabled, so forget held keys instead of leaving them stuck
+            pressed_keys.clear()
+            for timer in key_timers:
+                timer.active = val
+            return True
+
+        def handle_keyboard_switch(val: bool):
+            if not set_keyboard_active(val):
+                return
             if val:
                 ui.notify('Keyboard control activated', type='positive', close_button=True, timeout=1500)
             else:
@@ -26,6 +26,7 @@ DEFAULT_SETTINGS = {
     "homing_offsets": {i: 0 for i in range(6)},  # Homing offset for each joint
     "gear_ratios": [13.5, 150, 150, 48, 33.91, 33.91],
     "coupled_axis_mode": False,  # Whether to use coupled B/C axis mode for axes 4 and 5
+    "parallel_homing": False,  # Home independent arm axes (1-4) concurrently instead of one by one
 }
 
 class SettingsManager:
@@ -95,6 +96,27 @@ class SettingsManager:
             default if default is not None else DEFAULT_SETTINGS.get(key)
         )
 
+    def get_many(self, keys):
+        """
+        Retrieve several setting values at once.
+
+        Each key is resolved exactly like `get` without an explicit default, i.e. missing keys
+        fall back to DEFAULT_SETTINGS.
+
+        Args:
+            keys (Iterable[str]): The keys of the settings to retrieve.
+
+        Returns:
+            dict: A dictionary mapping each requested key to its value.
+
+        Example:
+            >>> settings = SettingsManager()
+            >>> settings.get_many(["theme", "speed_scale"])
+            {'theme': 'Light', 'speed_scale': 1.0}
+        """
+        settings = self.settings
+        return {key: settings.get(key, DEFAULT_SETTINGS.get(key)) for key in keys}
+
     def set(self, key, value):
         """
         Update a setting value and save it.
@@ -117,6 +117,28 @@ def close_gripper(Arctos, robot) -> None:
 
 
 # Functions to update joint states
+# Label prefixes are built once; the numbers are converted to degrees in one vectorized call per tick
+_JOINT_LABEL_PREFIXES = tuple(f"Joint {i+1}: " for i in range(6))
+
+def set_text_if_changed(label, text: str) -> None:
+    """
+    Sets the text of a UI label only if it differs from what is already displayed.
+
+    Live-update timers rewrite the same values many times while the robot stands still; skipping
+    unchanged labels avoids sending no-op updates to the browser. Values are formatted to a fixed
+    precision by the callers, which also hides floating point noise below the displayed digits.
+
+    Args:
+        label: The NiceGUI label to update.
+        text (str): The new text.
+
+    Returns:
+        None
+    """
+    if label.text != text:
+        label.set_text(text)
+
+
 
 def update_joint_states(robot, joint_positions):
     """
@@ -134,8 +156,9 @@ def update_joint_states(robot, joint_positions):
         Exception: For any unexpected UI or robot errors.
     """
     if robot:  # Stelle sicher, dass `robot` initialisiert ist
-        for i in range(6):
-            joint_positions[i].set_text(f"Joint {i+1}: {np.degrees(robot.q[i]):.2f}°")  # Umrechnung in Grad
+        q_deg = np.degrees(robot.q[:6]).tolist()  # Umrechnung in Grad
+        for label, prefix, angle in zip(joint_positions, _JOINT_LABEL_PREFIXES, q_deg):
+            set_text_if_changed(label, f"{prefix}{angle:.2f}°")
 
 
 
@@ -155,9 +178,9 @@ def live_update_ee_postion(robot, ee_position_labels):
         Exception: For any unexpected UI or robot errors.
     """
     if robot:  # Sicherstellen, dass `robot` initialisiert ist
-        ee_pos = robot.get_end_effector_position()  # Holt die Position als np.array [x, y, z]
-        for i, axis in enumerate(["X", "Y", "Z"]):
-            ee_position_labels[axis].set_text(f"{axis}: {ee_pos[i]:.2f} m")  # Setzt die UI-Werte
+        ee_pos = robot.get_end_effector_position().tolist()  # Holt die Position als [x, y, z]
+        for axis, value in zip(("X", "Y", "Z"), ee_pos):
+            set_text_if_changed(ee_position_labels[axis], f"{axis}: {value:.2f} m")  # Setzt die UI-Werte
 
 def live_update_ee_orientation(robot, ee_orientation_labels):
     """
@@ -175,10 +198,41 @@ def live_update_ee_orientation(robot, ee_orientation_labels):
         Exception: For any unexpected UI or robot errors.
     """
     if robot:  # Sicherstellen, dass `robot` existiert
-        ee_orient = np.degrees(robot.get_end_effector_orientation())  # In Grad umwandeln
+        ee_orient = np.degrees(robot.get_end_effector_orientation()).tolist()  # In Grad umwandeln
 
-        for i, axis in enumerate(["Roll", "Pitch", "Yaw"]):
-            ee_orientation_labels[axis].set_text(f"{axis}: {ee_orient[i]:.2f}°")  # UI aktualisieren
+        for axis, value in zip(("Roll", "Pitch", "Yaw"), ee_orient):
+            set_text_if_changed(ee_orientation_labels[axis], f"{axis}: {value:.2f}°")  # UI aktualisieren
+
+def update_pose_labels(robot, joint_positions=None, ee_position_labels=None, ee_orientation_labels=None):
+    """
+    Updates the joint and end-effector labels from a single snapshot of the robot state.
+
+    Used by the control page's one live-update tick instead of calling the three updaters above
+    separately: the state is read once and all angles are converted to degrees in one call.
+    Label groups passed as None (e.g. collapsed sections) are skipped.
+
+    Args:
+        robot: The robot instance providing robot.q and the end-effector pose.
+        joint_positions (list, optional): UI labels for the six joint angles.
+        ee_position_labels (dict, optional): UI labels keyed by axis ("X", "Y", "Z").
+        ee_orientation_labels (dict, optional): UI labels keyed by axis ("Roll", "Pitch", "Yaw").
+
+    Returns:
+        None
+    """
+    if not robot:
+        return
+    # Joint angles followed by roll/pitch/yaw, converted in one go
+    angles_deg = np.degrees(np.concatenate((robot.q[:6], robot.ee_orientation))).tolist()
+    if joint_positions is not None:
+        for label, prefix, angle in zip(joint_positions, _JOINT_LABEL_PREFIXES, angles_deg[:6]):
+            set_text_if_changed(label, f"{prefix}{angle:.2f}°")
+    if ee_position_labels is not None:
+        for axis, value in zip(("X", "Y", "Z"), robot.ee_position.tolist()):
+            set_text_if_changed(ee_position_labels[axis], f"{axis}: {value:.2f} m")
+    if ee_orientation_labels is not None:
+        for axis, value in zip(("Roll", "Pitch", "Yaw"), angles_deg[6:]):
+            set_text_if_changed(ee_orientation_labels[axis], f"{axis}: {value:.2f}°")
 
 def set_ee_position_from_input(robot, ee_position_inputs):
     """
@@ -380,36 +434,77 @@ def _process_joint_states(robot, current_joint_states, settings_manager):
     robot.q_encoder[:6] = [j0, j1, j2, j3, a4, a5]
     return True
 
-# Lock to prevent overlapping updates, ensuring stability at high frequencies
-_update_lock = asyncio.Lock()
-
-async def update_robot_joint_states_async(robot, Arctos, settings_manager, joint_positions_encoder=None):
+# Encoder readings are produced by one shared reader loop and pushed to every subscribed page.
+# All of this state is only touched from the event loop thread.
+# The loop only polls while a page is subscribed, so robot.q_encoder is only current while a
+# control page with live joint updates is open and visible; otherwise it keeps the last reading.
+ENCODER_POLL_PERIOD_S = 0.02
+_encoder_changed = None  # asyncio.Condition, created lazily inside the running loop
+_encoder_version = 0  # Bumped each time robot.q_encoder changes
+_encoder_subscribers = 0
+_encoder_reader_task = None
+
+async def _encoder_reader_loop(robot, Arctos, settings_manager):
     """
-    Asynchronously fetches robot joint states and updates the UI.
-    Uses a lock to prevent overlapping calls and run_in_executor for blocking hardware calls.
-    If UI elements are provided, it updates them directly for maximum responsiveness.
+    Polls the encoders while at least one page is subscribed and notifies subscribers on change.
+    Uses run_in_executor for the blocking hardware call; readings identical to the previous one
+    wake nobody, so idle robots cause no label work at all.
     """
-    if _update_lock.locked():
-        # Another update is already in progress, skip this cycle to avoid stacking up requests.
-        return
-
-    async with _update_lock:
-        loop = asyncio.get_event_loop()
+    global _encoder_version
+    loop = asyncio.get_running_loop()
+    last = None
+    while _encoder_subscribers:
+        started = loop.time()
         try:
             # Fetch hardware data
             current_joint_states = await loop.run_in_executor(None, Arctos.get_joint_angles)
-            
+
             # Process data and update internal model
-            success = _process_joint_states(robot, current_joint_states, settings_manager)
+            if _process_joint_states(robot, current_joint_states, settings_manager):
+                current = robot.q_encoder[:6].copy()
+                if last is None or not np.array_equal(current, last):
+                    last = current
+                    async with _encoder_changed:
+                        _encoder_version += 1
+                        _encoder_changed.notify_all()
+        except Exception as e:
+            print(f"Error in _encoder_reader_loop: {e}")
+        await asyncio.sleep(max(0.0, ENCODER_POLL_PERIOD_S - (loop.time() - started)))
 
-            # If successful and UI elements are provided, update them immediately
-            if success and joint_positions_encoder is not None:
-                for i in range(6):
-                    # Update UI label with the new encoder value, converted to degrees
-                    joint_positions_encoder[i].set_text(f"{np.degrees(robot.q_encoder[i]):.2f}°")
+async def stream_encoder_labels(robot, Arctos, settings_manager, joint_positions_encoder):
+    """
+    Keeps the given encoder labels in sync with the hardware until the task is cancelled.
 
-        except Exception as e:
-            print(f"Error in update_robot_joint_states_async: {e}")
+    Subscribes to the shared encoder reader (starting it if needed) and rewrites the labels only
+    when a new reading has been published, instead of waking up on a fixed timer.
+
+    Args:
+        robot: The robot instance whose q_encoder is updated by the reader.
+        Arctos: The robot controller used to read the encoders.
+        settings_manager: The settings manager (for the coupled axis mode).
+        joint_positions_encoder (list): The six UI labels showing the encoder angles.
+
+    Returns:
+        None. Runs until cancelled.
+    """
+    global _encoder_changed, _encoder_subscribers, _encoder_reader_task
+    if _encoder_changed is None:
+        _encoder_changed = asyncio.Condition()
+    _encoder_subscribers += 1
+    if _encoder_reader_task is None or _encoder_reader_task.done():
+        _encoder_reader_task = asyncio.create_task(_encoder_reader_loop(robot, Arctos, settings_manager))
+    seen = 0
+    try:
+        while True:
+            async with _encoder_changed:
+                await _encoder_changed.wait_for(lambda: _encoder_version != seen)
+                seen = _encoder_version
+            # Update UI labels with the new encoder values, converted to degrees in one call
+            for label, angle in zip(joint_positions_encoder, np.degrees(robot.q_encoder[:6]).tolist()):
+                set_text_if_changed(label, f"{angle:.2f}°")
+    finally:
+        # The reader loop stops by itself once the last subscriber is gone
+        _encoder_subscribers -= 1
 
 
 # Global scaling variable for speed